@@ -2,6 +2,8 @@
 import os
 import platform
 import json
+import subprocess
+import shutil
 
 
 class LayupParameters(object):
@@ -599,6 +601,90 @@ def load_parameters(json_name, dict_name="Geometry"):
     
     return dictionary
 
+def write_formatted_rows(f, array, fmt, n_chunk=10000):
+    '''
+    Write a 2-d array to an opened text file, one formatted row per line.
+    
+    Rows are formatted in chunks by a single `%` operation on a repeated row format,
+    which is faster than `numpy.savetxt` that formats the array row by row.
+    It does not need numpy, a list of rows can be written in the same way.
+    
+    Parameters
+    -----------------
+    f: file
+        opened text file
+    
+    array: ndarray [n_row, n_col], or list[list]
+        data to write
+    
+    fmt: str
+        format of a row, e.g., ' %14.6E'*6+' %d'
+        
+    n_chunk: int
+        number of rows formatted at a time
+    '''
+    if hasattr(array, 'tolist'):
+        rows = array.tolist()
+    else:
+        rows = array
+    
+    for i in range(0, len(rows), n_chunk):
+        
+        chunk = rows[i:i+n_chunk]
+        values = tuple([value for row in chunk for value in row])
+        
+        f.write(((fmt+'\n')*len(chunk)) % values)
+
+def run_abaqus_command(arguments):
+    '''
+    Run an Abaqus command without an intermediate shell, and wait for it to finish.
+    
+    Parameters
+    -----------------
+    arguments: list[str]
+        arguments of the `abaqus` command, e.g., ['cae', 'noGUI=job.py'].
+    
+    Returns
+    -----------------
+    returncode: int
+        return code of the command
+    '''
+    command = ['abaqus'] + list(arguments)
+    
+    #* `abaqus` is a batch file on Windows, which can only be run by the shell
+    process = subprocess.Popen(command, shell=(platform.system() == 'Windows'))
+    
+    return process.wait()
+
+def prepare_run_folder(path, files):
+    '''
+    Prepare a folder to run Abaqus/CAE scripts in, 
+    e.g., for jobs running at the same time in different folders.
+    
+    The scripts are copied to the folder, together with the `AbaqusTools` package,
+    because the scripts need to be in the same directory as the `AbaqusTools` folder.
+    
+    Parameters
+    -----------------
+    path: str
+        path of the folder
+    
+    files: list[str]
+        scripts to copy to the folder
+    '''
+    if not os.path.exists(path):
+        os.makedirs(path)
+    
+    for fname in files:
+        shutil.copy(fname, path)
+    
+    path_package = os.path.join(path, 'AbaqusTools')
+    if os.path.exists(path_package):
+        shutil.rmtree(path_package)
+    
+    shutil.copytree(os.path.dirname(os.path.abspath(__file__)), path_package,
+                    ignore=shutil.ignore_patterns('*.pyc', '__pycache__'))
+
 def clean_pyc_files(path='.'):
     
     if platform.system() == 'Windows':
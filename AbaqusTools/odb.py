@@ -46,11 +46,44 @@ class OdbOperation(object):
         self.mapping_elem_label2index = None
         self.mapping_elem_index2label = None
         
+        #* Cache of FieldOutput objects and their subsets,
+        #* keyed by names because Abaqus objects are not hashable
+        self._fieldOutput_cache = {}
+        self._subset_cache = {}
+        
         #* Loads odb file and create a new Odb object
         session.openOdb(name=self.name_job, path=self.name_job)
         self._odb = session.odbs[self.name_job]
         session.viewports['Viewport: 1'].setValues(displayedObject=self._odb)
     
+    def __enter__(self):
+        '''
+        Use as a context manager, e.g., `with OdbOperation(name_job) as odb:`.
+        
+        The FieldOutput objects of common variables in the last frame of the 'Loading' step
+        are cached on entering, so that the probes do not look them up again.
+        '''
+        steps = session.odbs[self.name_job].steps
+        
+        if 'Loading' in steps.keys():
+            
+            fieldOutputs = steps['Loading'].frames[-1].fieldOutputs
+            
+            for variable in ['S', 'E', 'U', 'RF', 'UVARM']:
+                if variable in fieldOutputs.keys():
+                    self.get_fieldOutput(step='Loading', frame=-1, variable=variable)
+        
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        '''
+        Clear the caches and close the output database.
+        '''
+        self.clear_cache()
+        self._odb.close()
+        
+        return False
+    
     @property
     def odb(self):
         '''
@@ -241,13 +274,27 @@ class OdbOperation(object):
             The text of a SymbolicConstant specifying output type.
             Possible values are SCALAR, VECTOR, TENSOR_3D_FULL, TENSOR_3D_PLANAR, TENSOR_3D_SURFACE, TENSOR_2D_PLANAR, and TENSOR_2D_SURFACE.
         '''
-        fieldOutput = session.odbs[self.name_job].steps[step].frames[frame].fieldOutputs[variable]
+        key = (step, frame, variable)
         
-        position = fieldOutput.locations[0].position.getText()
+        if key not in self._fieldOutput_cache:
         
-        data_type = fieldOutput.type.getText()
+            fieldOutput = session.odbs[self.name_job].steps[step].frames[frame].fieldOutputs[variable]
+            
+            position = fieldOutput.locations[0].position.getText()
+            
+            data_type = fieldOutput.type.getText()
+            
+            self._fieldOutput_cache[key] = (fieldOutput, position, data_type)
         
-        return fieldOutput, position, data_type
+        return self._fieldOutput_cache[key]
+    
+    def clear_cache(self):
+        '''
+        Clear the cached FieldOutput objects and subsets,
+        e.g., when the odb has been re-opened after a new analysis.
+        '''
+        self._fieldOutput_cache = {}
+        self._subset_cache = {}
     
     def get_num_frames(self, step='Loading'):
         '''
@@ -750,18 +797,77 @@ class OdbOperation(object):
             
         return values
     
+    def probe_element_values_multi(self, step='Loading', frame=-1, variable='S', 
+                                   components=('S11', 'S22', 'S12'), index_fieldOutput=[]):
+        '''
+        Probe several components of a variable for a list of elements. The value is stored in integration point(s).
+        
+        The fieldOutput values are traversed once for all components,
+        instead of once per component as in `probe_element_values`.
+        
+        Parameters
+        ----------------
+        step: str
+            name of the step, e.g., 'Loading'
+        
+        frame: int
+            index of the frame, default -1 means the last frame
+            
+        variable: str
+            name of the output variable, e.g., 'S', 'E', etc.
+        
+        components: tuple[str]
+            names of the components, e.g., ('S11', 'S22', 'S12').
+        
+        index_fieldOutput: list[int]
+            indices of the elements in the fieldOutputs, which contains all elements from all instances.
+        
+        Returns
+        ---------------
+        values: ndarray [n_element, n_comp]
+            an array of values, the columns follow the order of `components`.
+        '''
+        fieldOutput, position, _ = self.get_fieldOutput(step, frame, variable)
+
+        if not position == 'INTEGRATION_POINT':
+            
+            print('Error [probe_element_values_multi]: the variable is not stored in elements')
+            print('    Step: [%s]; Frame: [%d]'%(step, frame))
+            print('    The location of field data for [%s] is [%s]'%(variable, position))
+            raise Exception()
+        
+        indices_comp = [fieldOutput.componentLabels.index(component) for component in components]
+        
+        fieldValues = fieldOutput.values
+        
+        values = np.empty((len(index_fieldOutput), len(components)))
+        
+        for i_elem in range(len(index_fieldOutput)):
+            
+            data = fieldValues[index_fieldOutput[i_elem]].data
+            
+            for j, index_comp in enumerate(indices_comp):
+                values[i_elem, j] = data[index_comp]
+            
+        return values
+    
     def probe_element_set_values(self, step='Loading', frame=-1, variable='S', component=None,
                                  name_instance='ASSEMBLY', name_set=None):
         '''
         Probe values of a set of elements. The value is stored in integration point(s).
         '''
-        _frame = session.odbs[self.name_job].steps[step].frames[frame]
-        _field = _frame.fieldOutputs[variable]
-        if isinstance(component, str):
-            _field = _field.getScalarField(componentLabel=component)
+        key = (step, frame, variable, component, name_instance, name_set)
+        
+        if key not in self._subset_cache:
+        
+            _field, _, _ = self.get_fieldOutput(step, frame, variable)
+            if isinstance(component, str):
+                _field = _field.getScalarField(componentLabel=component)
+            
+            elem_set = self.odb.rootAssembly.instances[name_instance].elementSets[name_set]
+            self._subset_cache[key] = _field.getSubset(region=elem_set, position=INTEGRATION_POINT)
         
-        elem_set = self.odb.rootAssembly.instances[name_instance].elementSets[name_set]
-        data = _field.getSubset(region=elem_set, position=INTEGRATION_POINT)
+        data = self._subset_cache[key]
         
         element_labels = []
         values = []
@@ -1002,6 +1108,68 @@ class OdbOperation(object):
     
         return values
     
+    def probe_shell_element_thickness_values_multi(self, variable='S', components=('S11', 'S22', 'S12'),
+                                    name_instance='PLATE', element_label=[], index_fieldOutput=None):
+        '''
+        Probe several components of zero-thickness shell elements' thickness-direction-distributed data.
+        Need to provide either the element labels in its instance, or their indices in the fieldOutput.
+        
+        The index-to-label conversion and the data organization are done once for all components.
+        The thickness coordinates are the same for all elements of the same section,
+        so they are taken from the first element and returned separately.
+        
+        Parameters
+        --------------
+        variable: str
+            name of the output variable, e.g., 'E', 'S'.
+        
+        components: tuple[str]
+            names of the components, e.g., ('S11', 'S22', 'S12').
+            
+        name_instance: str
+            name of an instance in CAPITAL letters, e.g., 'ASSEMBLY'.
+        
+        element_label: list[int]
+            labels of elements in the instance, it starts from 1.
+        
+        index_fieldOutput: None, or list[int]
+            indices of the elements in the fieldOutputs, which contains all elements from all instances.
+        
+        Returns
+        ---------------
+        thickness_coordinates: ndarray [n_thickness]
+            coordinates of the data points in the thickness direction.
+        
+        values: ndarray [n_element, n_thickness, n_comp]
+            an array of values through the thickness, i.e., [[(comp1, comp2, ...), ...], ...].
+        '''
+        #* Convert index to label
+        if index_fieldOutput is not None:
+            element_label, _name_instance = self.convert_IdxFO_to_Label(index_fieldOutput, label_type='element')
+            if not _name_instance == name_instance:
+                print('Error [probe_shell_element_thickness_values_multi]: the elements are not in the specified instance')
+                print('    Input name_instance: %s'%(name_instance))
+                print('    Found name_instance: %s'%(_name_instance))
+                raise Exception
+        
+        thickness_coordinates = None
+        values = None
+        
+        for j, component in enumerate(components):
+            
+            #* Get data: Dict[int, ndarray]
+            xyDataDict = OdbOperation._get_XYDataFromShellThickness_from_element_label(
+                self.odb, variable, component, name_instance, element_label)
+            
+            if values is None:
+                thickness_coordinates = xyDataDict[element_label[0]][:,0].copy()
+                values = np.empty((len(element_label), len(thickness_coordinates), len(components)))
+            
+            for i_element in range(len(element_label)):
+                values[i_element,:,j] = xyDataDict[element_label[i_element]][:,1]
+    
+        return thickness_coordinates, values
+    
     @staticmethod
     def _get_XYDataFromShellThickness_from_element_label(odb,
                 variable='E', component='E11',name_instance='PLATE', element_label=1):
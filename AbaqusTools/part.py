@@ -47,6 +47,12 @@ class Part(object):
         self.name_part = 'Part'
         
         self.is_only_geometry = False
+        
+        #* Feature id of datums by name, filled by the subclass when the datums are created
+        self._datum_ids = {}
+        
+        #* Sketch transform of the X-Y plane, created in `_sketch_transform_xy`
+        self._xy_transform = None
     
     #* =============================================
     #* Abaqus procedure
@@ -315,6 +321,47 @@ class Part(object):
         id_datum = myPrt.features[name].id
         return myPrt.datums[id_datum]
 
+    def _datum(self, name):
+        '''
+        Get the datum object by name, using the feature id cached in `self._datum_ids`.
+        
+        Parameters
+        --------------
+        name: str
+            name of the datum, e.g., 'XYPLANE', 'XAXIS', 'csys_plate'.
+            
+        Returns
+        --------------
+        datum: Datum object
+        '''
+        return self.model.parts[self.name_part].datums[self._datum_ids[name]]
+    
+    def _sketch_transform_xy(self, myPrt):
+        '''
+        Get the sketch transform of the X-Y plane (z=0), with the X axis as the sketch up edge.
+        The datums 'XYPLANE' and 'XAXIS' need to be in `self._datum_ids`.
+        
+        The transform is made in the first call and reused by later sketches of the part, 
+        so that they have the same orientation.
+        
+        Parameters
+        --------------
+        myPrt: Abaqus Part
+            Part object
+            
+        Returns
+        --------------
+        transform: Transform object
+        '''
+        if self._xy_transform is None:
+            
+            self._xy_transform = myPrt.MakeSketchTransform(
+                sketchPlane=self._datum('XYPLANE'),
+                sketchUpEdge=self._datum('XAXIS'), 
+                sketchPlaneSide=SIDE1, sketchOrientation=BOTTOM, origin=(0.0, 0.0, 0.0))
+        
+        return self._xy_transform
+
     @staticmethod
     def create_datum_point(myPrt, x, y, z):
         '''
@@ -645,7 +692,7 @@ class Part(object):
         return edges
 
     @staticmethod
-    def get_edges(myPrt, findAt_points, getClosest=False, searchTolerance=1E-6):
+    def get_edges(myPrt, findAt_points, getClosest=False, searchTolerance=1E-6, batch=False):
         '''
         Get a EdgeArray (Sequence) by the `findAt` or `getClosest` command.
         
@@ -668,6 +715,10 @@ class Part(object):
         searchTolerance: float
             the distance within which the closest object must lie
             
+        batch: bool
+            whether find all edges by one `findAt` query (without `getClosest`),
+            each point must be on a different edge
+            
         Returns
         -------------
         edges: Abaqus EdgeArray (Sequence)
@@ -676,6 +727,9 @@ class Part(object):
         if isinstance(findAt_points, tuple):
             findAt_points = [findAt_points]
         
+        if batch and not getClosest:
+            return Part._find_in_batch(myPrt.edges, findAt_points, 'edge')
+        
         edges = None
         for pt in findAt_points:
             
@@ -734,7 +788,7 @@ class Part(object):
         return faces
 
     @staticmethod
-    def get_cells(myPrt, findAt_points):
+    def get_cells(myPrt, findAt_points, batch=False):
         '''
         Get a CellArray (Sequence) by the `findAt` command.
         
@@ -751,6 +805,10 @@ class Part(object):
             
             `findAt_points` can be either a tuple of one point, or a list of point tuples.
             
+        batch: bool
+            whether find all cells by one `findAt` query,
+            each point must be in a different cell
+            
         Returns
         -------------
         cells: Abaqus CellArray (Sequence)
@@ -759,6 +817,9 @@ class Part(object):
         if isinstance(findAt_points, tuple):
             findAt_points = [findAt_points]
         
+        if batch:
+            return Part._find_in_batch(myPrt.cells, findAt_points, 'cell')
+        
         cells = None
         for pt in findAt_points:
 
@@ -771,6 +832,38 @@ class Part(object):
         
         return cells
     
+    @staticmethod
+    def _find_in_batch(array, findAt_points, geometry):
+        '''
+        Find the objects at all points by one `findAt` query, 
+        i.e., `array.findAt((pt1,), (pt2,), ...)`.
+        
+        Parameters
+        -------------
+        array: Abaqus EdgeArray, CellArray, etc.
+            sequence of the objects, e.g., `myPrt.edges`
+            
+        findAt_points: list of tuple
+            point coordinates, each point locates a different object
+            
+        geometry: str
+            name of the object, used in the error message
+            
+        Returns
+        -------------
+        objects: Abaqus EdgeArray, CellArray, etc.
+            the objects found at these points, None if there is no point
+        '''
+        if len(findAt_points) == 0:
+            return None
+        
+        objects = array.findAt(*[(tuple(pt),) for pt in findAt_points])
+        
+        if len(objects) != len(findAt_points):
+            raise Exception('Found %d %s(s) at %d points'%(len(objects), geometry, len(findAt_points)))
+        
+        return objects
+    
     @staticmethod
     def get_vertex_DatumPointByEdgeParam(myPrt, edge, parameter=0.5):
         '''
@@ -615,20 +615,26 @@ class PBC_3DOrthotropic(PeriodicBC):
         '''
         import numpy as np
         
-        stiffness_matrix = np.array(stiffness_matrix)
+        stiffness_matrix = np.array(stiffness_matrix, dtype=float)
         C_avg = 0.5*(stiffness_matrix + stiffness_matrix.T)
         S_avg = np.linalg.inv(C_avg)
         
+        #* Moduli E11, E22, E33, G23, G13, G12 from the diagonal of the compliance matrix
+        moduli = (1.0/np.diag(S_avg)).tolist()
+        
+        #* Poisson's ratios niu12, niu13, niu23
+        nius = (- S_avg[[0, 0, 1], [1, 2, 2]] / S_avg[[0, 0, 1], [0, 0, 1]]).tolist()
+        
         result = {
-            'E11': 1.0 / S_avg[0, 0],
-            'E22': 1.0 / S_avg[1, 1],
-            'E33': 1.0 / S_avg[2, 2],
-            'G23': 1.0 / S_avg[3, 3],
-            'G13': 1.0 / S_avg[4, 4],
-            'G12': 1.0 / S_avg[5, 5],
-            'niu12': - S_avg[0, 1] / S_avg[0, 0],
-            'niu13': - S_avg[0, 2] / S_avg[0, 0],
-            'niu23': - S_avg[1, 2] / S_avg[1, 1],
+            'E11': moduli[0],
+            'E22': moduli[1],
+            'E33': moduli[2],
+            'G23': moduli[3],
+            'G13': moduli[4],
+            'G12': moduli[5],
+            'niu12': nius[0],
+            'niu13': nius[1],
+            'niu23': nius[2],
             'stiffness_matrix': stiffness_matrix.tolist(),
             'compliance_matrix': S_avg.tolist(),
             'C_avg': C_avg.tolist()
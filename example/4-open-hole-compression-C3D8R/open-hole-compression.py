@@ -9,6 +9,7 @@ Open Hole Compression Test of a Composite Plate using Abaqus/CAE Python Scriptin
 '''
 import os
 import time
+import itertools
 import numpy as np
 from AbaqusTools import Part, IS_ABAQUS
 
@@ -22,6 +23,11 @@ from AbaqusTools import Part, Model
 from AbaqusTools.functions import LayupParameters
 
 
+#* Field output variables, without/with the UVARM user subroutine
+FIELD_OUTPUT_VARIABLES = ('S', 'E', 'U')
+FIELD_OUTPUT_VARIABLES_UVARM = FIELD_OUTPUT_VARIABLES + ('UVARM',)
+
+
 class Plate(Part):
     '''
     Plate with an open hole.
@@ -42,6 +48,21 @@ class Plate(Part):
         self.r_hole = self.pGeo['r_hole']
         
         self._cal_partition_dimensions()
+        self._cal_ply_xy_offsets()
+        
+        #* Number of plies and the orientation angle of each ply
+        #* (a tuple of Python numbers, which can be passed to Abaqus directly)
+        layup = self.pMesh['plate_CompositePly_orientationValue']
+        
+        if self.pMesh['plate_CompositeLayup_symmetric']:
+            self._angles = tuple(layup) + tuple(reversed(layup))
+        else:
+            self._angles = tuple(layup)
+            
+        self._num_ply = len(self._angles)
+        
+        #* Whether print the seeding time of each ply in `loop_over_plies`
+        self.verbose_ply_loop = self.pMesh.get('verbose_ply_loop', True)
 
     def build(self):
         '''
@@ -123,6 +144,29 @@ class Plate(Part):
             self.r_hole + ratio_square*dy0, self.r_hole + ratio_square*dy1
             )
 
+    def _cal_ply_xy_offsets(self, epsilon=0.001):
+        '''
+        Calculate the x-y offsets (to the hole center) of the points 
+        that locate the cells of one ply, i.e., ndarray [16, 2].
+        
+        - 8 cells around the hole (partition circle and partition square);
+        - 8 cells of rectangular blocks outside the partition square.
+        '''
+        dc = 0.5*(self.r_hole + self.r_partition)
+        ds = 0.5*(self.r_partition + self.width_partition*0.5)
+        dw = 0.5*self.width_partition + epsilon
+        
+        angles = np.repeat(0.5*np.pi*np.arange(4), 2)
+        radius = np.tile([dc, ds], 4)
+        
+        offsets = np.zeros((16,2))
+        offsets[:8,0] = radius*np.sin(angles)
+        offsets[:8,1] = radius*np.cos(angles)
+        offsets[8:,:] = [[-dw, -dw], [0.0, -dw], [dw, -dw], [-dw, 0.0], 
+                         [ dw, 0.0], [-dw,  dw], [0.0, dw], [dw,  dw]]
+        
+        self._ply_xy_offsets = offsets
+
     def create_sketch(self):
         '''
         Create the sketch in X-Y plane.
@@ -159,25 +203,27 @@ class Plate(Part):
         myPrt = self.model.Part(name=self.name_part, dimensionality=THREE_D, type=DEFORMABLE_BODY)
     
         #* Reference plane and axis
-        myPrt.DatumPlaneByPrincipalPlane(principalPlane=XYPLANE, offset=0.0)
+        feature = myPrt.DatumPlaneByPrincipalPlane(principalPlane=XYPLANE, offset=0.0)
         self.rename_feature(myPrt, 'XYPLANE')
+        self._datum_ids['XYPLANE'] = feature.id
         
-        myPrt.DatumAxisByPrincipalAxis(principalAxis=XAXIS)
+        feature = myPrt.DatumAxisByPrincipalAxis(principalAxis=XAXIS)
         self.rename_feature(myPrt, 'XAXIS')
+        self._datum_ids['XAXIS'] = feature.id
         
-        myPrt.DatumAxisByPrincipalAxis(principalAxis=YAXIS)
+        feature = myPrt.DatumAxisByPrincipalAxis(principalAxis=YAXIS)
         self.rename_feature(myPrt, 'YAXIS')
+        self._datum_ids['YAXIS'] = feature.id
         
-        myPrt.DatumAxisByPrincipalAxis(principalAxis=ZAXIS)
+        feature = myPrt.DatumAxisByPrincipalAxis(principalAxis=ZAXIS)
         self.rename_feature(myPrt, 'ZAXIS')
+        self._datum_ids['ZAXIS'] = feature.id
         
         self.create_datum_csys_3p(myPrt, 'csys_plate', origin=[0.0, 0.0, 0.0], dx=[1, 0, 0], dy=[0, 1, 0])
+        self._datum_ids['csys_plate'] = myPrt.features['csys_plate'].id
         
         #* Plane for plate sketch
-        transform = myPrt.MakeSketchTransform(
-            sketchPlane=self.get_datum_by_name(myPrt, 'XYPLANE'),
-            sketchUpEdge=self.get_datum_by_name(myPrt, 'XAXIS'), 
-            sketchPlaneSide=SIDE1, sketchOrientation=BOTTOM, origin=(0.0, 0.0, 0.0))
+        transform = self._sketch_transform_xy(myPrt)
     
         #* Section sketch
         mySkt = self.model.ConstrainedSketch(name='__profile__', sheetSize=200, transform=transform)
@@ -266,10 +312,7 @@ class Plate(Part):
         myPrt = self.model.parts[self.name_part]
         
         #* Partition face by sketch
-        transform = myPrt.MakeSketchTransform(
-            sketchPlane=self.get_datum_by_name(myPrt, 'XYPLANE'),
-            sketchUpEdge=self.get_datum_by_name(myPrt, 'XAXIS'), 
-            sketchPlaneSide=SIDE1, sketchOrientation=BOTTOM, origin=(0.0, 0.0, 0.0))
+        transform = self._sketch_transform_xy(myPrt)
     
         mySkt = self.model.ConstrainedSketch(name='__profile__', sheetSize=200, transform=transform)
         mySkt.sketchOptions.setValues(gridOrigin=(0.0, 0.0), gridAngle=0.0)
@@ -279,7 +322,7 @@ class Plate(Part):
         mySkt.retrieveSketch(sketch=self.model.sketches['partition_top_view'])
 
         myPrt.PartitionFaceBySketch(
-                sketchUpEdge=self.get_datum_by_name(myPrt, 'XAXIS'), 
+                sketchUpEdge=self._datum('XAXIS'), 
                 faces=myPrt.surfaces['face_z0'].faces,
                 sketchOrientation=BOTTOM, sketch=mySkt)
 
@@ -290,7 +333,7 @@ class Plate(Part):
         myPrt.Set(edges=edges, name='edge_partition_circle')
         
         myPrt.PartitionCellByExtrudeEdge(
-            line=self.get_datum_by_name(myPrt, 'ZAXIS'), 
+            line=self._datum('ZAXIS'), 
             cells=myPrt.cells, edges=edges, sense=FORWARD)
         
         dd = 0.5*(self.r_partition+self.r_hole)
@@ -366,7 +409,9 @@ class Plate(Part):
         t0 = time.time()
         for i_ply in range(num_ply):
             
-            t1 = time.time()
+            if self.verbose_ply_loop:
+                t1 = time.time()
+            
             r0 = (i_ply*1.0)/num_ply
             r1 = (i_ply+1.0)/num_ply
             z0 = (1-r0)*z_bottom + r0*z_top
@@ -376,9 +421,11 @@ class Plate(Part):
             
             self._create_set_ply(z0, z1, i_ply)
             
-            t2 = time.time()
-            print('>>> Seeding ply %2d of [%s], t= %.1f s'%(i_ply+1, self.name_part, t2-t1))
-            
+            if self.verbose_ply_loop:
+                t2 = time.time()
+                print('>>> Seeding ply %2d of [%s], t= %.1f s'%(i_ply+1, self.name_part, t2-t1))
+        
+        t2 = time.time()
         print('>>> Seeding [%s], t= %.1f min'%(self.name_part, (t2-t0)/60.0))
 
     #* Meshing
@@ -453,7 +500,7 @@ class Plate(Part):
         num_ply: int
             number of plies
         '''
-        return len(self.pMesh['plate_CompositePly_orientationValue']) * (1 + self.pMesh['plate_CompositeLayup_symmetric'])
+        return self._num_ply
     
     def get_angle_ply(self, i_ply):
         '''
@@ -469,15 +516,7 @@ class Plate(Part):
         angle: float
             the composite ply's orientation angle (degree)
         '''
-        layup = self.pMesh['plate_CompositePly_orientationValue']
-        
-        ii = i_ply
-        
-        if self.pMesh['plate_CompositeLayup_symmetric'] and i_ply>=len(layup):
-        
-            ii = 2*len(layup) - i_ply - 1
-
-        return layup[ii]
+        return self._angles[i_ply]
     
     #* Continuum shell modeling
     
@@ -507,6 +546,16 @@ class Plate(Part):
 
         dc = 0.5*(self.r_hole + self.r_partition)
         ds = 0.5*(self.r_partition + self.width_partition*0.5)
+        
+        #* Bias end (end1Edges or end2Edges) of the radial edges at each angle
+        if not reverse:
+            ends = ('end1', 'end1', 'end2', 'end2')
+        else:
+            ends = ('end2', 'end2', 'end1', 'end1')
+
+        #* Points on the radial edges, grouped by {end1, end2} x {circle, square}
+        points_c = {'end1': [], 'end2': []}
+        points_s = {'end1': [], 'end2': []}
 
         for i in range (4):
             
@@ -517,27 +566,20 @@ class Plate(Part):
 
             x_s = self.xc_hole + ds*np.sin(angle)
             y_s = self.yc_hole + ds*np.cos(angle)
-
-            edges_c = self.get_edges(myPrt, (x_c,y_c,z), getClosest=False)
-            edges_s = self.get_edges(myPrt, (x_s,y_s,z), getClosest=False)
             
-            if not reverse:
-                
-                if i in [0, 1]:
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end1Edges=edges_c, ratio=ratio_circle, number=number_circle, constraint=FIXED)
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end1Edges=edges_s, ratio=ratio_square, number=number_square, constraint=FIXED)
-                else:
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end2Edges=edges_c, ratio=ratio_circle, number=number_circle, constraint=FIXED)
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end2Edges=edges_s, ratio=ratio_square, number=number_square, constraint=FIXED)
-
-            else:
-
-                if i in [0, 1]:
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end2Edges=edges_c, ratio=ratio_circle, number=number_circle, constraint=FIXED)
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end2Edges=edges_s, ratio=ratio_square, number=number_square, constraint=FIXED)
-                else:
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end1Edges=edges_c, ratio=ratio_circle, number=number_circle, constraint=FIXED)
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end1Edges=edges_s, ratio=ratio_square, number=number_square, constraint=FIXED)
+            points_c[ends[i]].append((x_c,y_c,z))
+            points_s[ends[i]].append((x_s,y_s,z))
+        
+        #* One seeding call for each group of edges
+        for end in ['end1', 'end2']:
+            
+            edges_c = self.get_edges(myPrt, points_c[end], getClosest=False, batch=True)
+            edges_s = self.get_edges(myPrt, points_s[end], getClosest=False, batch=True)
+            
+            myPrt.seedEdgeByBias(biasMethod=SINGLE, ratio=ratio_circle, number=number_circle, constraint=FIXED, 
+                                    **{end+'Edges': edges_c})
+            myPrt.seedEdgeByBias(biasMethod=SINGLE, ratio=ratio_square, number=number_square, constraint=FIXED, 
+                                    **{end+'Edges': edges_s})
 
     def _seed_edge_face_circumferential_partition(self, myPrt, z):
         '''
@@ -545,43 +587,15 @@ class Plate(Part):
         '''
         num_circum = self.pMesh['hole_circumferential_num_seedEdgeByNumber']
         
-        #* Hole edges
-        edges = self.get_edges(myPrt, (self.xc_hole - self.r_hole, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole + self.r_hole, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
+        #* Hole edges, partition circle edges, partition square edges
+        radius = np.repeat([self.r_hole, self.r_partition, 0.5*self.width_partition], 4)
         
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole - self.r_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
+        points = np.zeros((12,3))
+        points[:,0] = self.xc_hole + radius*np.tile([-1.0, 1.0, 0.0, 0.0], 3)
+        points[:,1] = self.yc_hole + radius*np.tile([ 0.0, 0.0,-1.0, 1.0], 3)
+        points[:,2] = z
         
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole + self.r_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        #* Partition circle edges
-        edges = self.get_edges(myPrt, (self.xc_hole - self.r_partition, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole + self.r_partition, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole - self.r_partition, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole + self.r_partition, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        #* Partition square edges
-        edges = self.get_edges(myPrt, (self.xc_hole - 0.5*self.width_partition, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-
-        edges = self.get_edges(myPrt, (self.xc_hole + 0.5*self.width_partition, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole - 0.5*self.width_partition, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole + 0.5*self.width_partition, z))
+        edges = self.get_edges(myPrt, [tuple(pt) for pt in points.tolist()], batch=True)
         myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
                     
     def _create_mesh_cs(self):
@@ -655,42 +669,20 @@ class Plate(Part):
             index of the ply
         '''
         z_mid = 0.5*(z0+z1)
-        width = 0.5*self.width_partition
+        n_point = self._ply_xy_offsets.shape[0]
 
-        EPSILON = 0.001
-        ANGLE_INCREMENT= 0.5*np.pi
-
-        #* Cells around the hole
-        dc = 0.5*(self.r_hole + self.r_partition)
-        ds = 0.5*(self.r_partition + self.width_partition*0.5)
-
-        points=[]
-        for i in range (4):
-            
-            angle= ANGLE_INCREMENT * i
-            
-            x = self.xc_hole + dc*np.sin(angle)
-            y = self.yc_hole + dc*np.cos(angle)
-            points.append((x,y,z_mid))
-            
-            x = self.xc_hole + ds*np.sin(angle)
-            y = self.yc_hole + ds*np.cos(angle)
-            points.append((x,y,z_mid))
-            
-        #* Cells of rectangular blocks
-        points += [
-            (self.xc_hole - width - EPSILON,    self.yc_hole - width - EPSILON, z_mid),
-            (self.xc_hole,                      self.yc_hole - width - EPSILON, z_mid),
-            (self.xc_hole + width + EPSILON,    self.yc_hole - width - EPSILON, z_mid),
-            (self.xc_hole - width - EPSILON,    self.yc_hole,                   z_mid),
-            (self.xc_hole + width + EPSILON,    self.yc_hole,                   z_mid),
-            (self.xc_hole - width - EPSILON,    self.yc_hole + width + EPSILON, z_mid),
-            (self.xc_hole,                      self.yc_hole + width + EPSILON, z_mid),
-            (self.xc_hole + width + EPSILON,    self.yc_hole + width + EPSILON, z_mid),
-        ]
+        #* Cells around the hole and cells of rectangular blocks
+        points = np.column_stack([
+            self.xc_hole + self._ply_xy_offsets[:,0], 
+            self.yc_hole + self._ply_xy_offsets[:,1], 
+            np.full(n_point, z_mid)])
+        
+        points = [tuple(pt) for pt in points.tolist()]
 
-        #* Create set
-        self.create_geometry_set('ply-%d'%(i_ply+1), points, geometry='cell')
+        #* Create set, the cells are found by one `findAt` query
+        myPrt = self.model.parts[self.name_part]
+        cells = self.get_cells(myPrt, points, batch=True)
+        myPrt.Set(cells=cells, name='ply-%d'%(i_ply+1))
 
     def _create_mesh_ply(self):
 
@@ -728,16 +720,38 @@ class Plate(Part):
             offsetType=MIDDLE_SURFACE, offsetField='', thicknessAssignment=FROM_SECTION)
         
         num_ply = self.get_num_ply()
-
+        
+        localCsys = self._datum('csys_plate')
+        
+        #* Group the ply sets by the orientation angle
+        angles = []
+        name_sets = {}
+        
         for i_ply in range(num_ply):
             
-            name_set = 'ply-%d'%(i_ply+1)
-            
             angle = self.get_angle_ply(i_ply)
+            
+            if angle not in name_sets:
+                angles.append(angle)
+                name_sets[angle] = []
+            
+            name_sets[angle].append('ply-%d'%(i_ply+1))
 
-            localCsys = self.get_datum_by_name(myPrt, 'csys_plate')
+        #* One material orientation for all plies with the same angle
+        for i_angle, angle in enumerate(angles):
+            
+            if len(name_sets[angle]) == 1:
+                
+                region = myPrt.sets[name_sets[angle][0]]
+            
+            else:
+                
+                name_set = 'plies-angle-%d'%(i_angle+1)
+                myPrt.SetByBoolean(name=name_set, 
+                    sets=tuple([myPrt.sets[name] for name in name_sets[angle]]), operation=UNION)
+                region = myPrt.sets[name_set]
             
-            myPrt.MaterialOrientation(region=myPrt.sets[name_set], 
+            myPrt.MaterialOrientation(region=region, 
                 orientationType=SYSTEM, 
                 axis=AXIS_3,                # Additional Rotation Direction
                 localCsys=localCsys,        # Orientation by a datum CSYS
@@ -747,7 +761,6 @@ class Plate(Part):
                 angle=angle,                # Additional Rotation angle (degree)
                 stackDirection=STACK_3)     # Stacking Direction (STACK_3: bottom to top)
 
-
 class TestModel(Model):
     
     def __init__(self, name_job, pGeo, pMesh, pRun, displacement=[0.0, -1.0, 0.0]):
@@ -841,10 +854,10 @@ class TestModel(Model):
                     print('    Output frequency is changed to [Evenly spaced time intervals]')
         
         #* Output variables
-        variables1=('S', 'E', 'U')
-
         if self.pMesh['user_subroutine'] == 'UVARM':
-            variables1=('S', 'E', 'U', 'UVARM')
+            variables1 = FIELD_OUTPUT_VARIABLES_UVARM
+        else:
+            variables1 = FIELD_OUTPUT_VARIABLES
 
         if numIntervals <= 0:
             self.model.fieldOutputRequests['F-Output-1'].setValues(variables=variables1, frequency=frequency)
@@ -913,6 +926,7 @@ if __name__ == '__main__':
         'square_radial_num_seedEdgeByBias': 8,
         
         'plate_seedPart_size': 2.0,
+        'verbose_ply_loop': True,
         'plate_CompositeLayup_symmetric': True,
         'plate_CompositePly_numIntPoints': 3,
         'plate_CompositePly_orientationValue':[ 45, -45, 0, 0, 45, 90, -45, 0, 0, 90,
@@ -951,20 +965,20 @@ if __name__ == '__main__':
         
         if os.path.exists('input.txt'):
             
+            #* Second column of the first 8 `name value` lines, as Python floats
             with open('input.txt', 'r') as f:
-                
-                lines = f.readlines()
-                
-                pGeo['len_x_plate'] = float(lines[0].split()[1])
-                pGeo['len_y_plate'] = float(lines[1].split()[1])
-                pGeo['thk_z_plate'] = float(lines[2].split()[1])
-                pGeo['xr_hole_center'] = float(lines[3].split()[1])
-                pGeo['yr_hole_center'] = float(lines[4].split()[1])
-                pGeo['r_hole'] = float(lines[5].split()[1])
-                
-                strain = float(lines[6].split()[1])
-                
-                index_layup = int(float(lines[7].split()[1]))
+                values = np.loadtxt(itertools.islice(f, 8), usecols=(1,)).tolist()
+            
+            pGeo['len_x_plate'] = values[0]
+            pGeo['len_y_plate'] = values[1]
+            pGeo['thk_z_plate'] = values[2]
+            pGeo['xr_hole_center'] = values[3]
+            pGeo['yr_hole_center'] = values[4]
+            pGeo['r_hole'] = values[5]
+            
+            strain = values[6]
+            
+            index_layup = int(values[7])
                 
             #* Update parameters
             
@@ -2,8 +2,10 @@
 Extract data from the *.odb file.
 '''
 import time
+import numpy as np
 
 from AbaqusTools import OdbOperation
+from AbaqusTools.functions import write_formatted_rows
 
 try:
 
@@ -19,6 +21,10 @@ except:
 # SET_NAME = [ ['PLATE',     ['ALL']] ]
 SET_NAME = [ ['PLATE',     ['PARTITION_CIRCLE']] ]
 
+#* Write the 3D stress field to a binary HDF5 file (requires `h5py`) instead of the Tecplot file.
+#* Use `h5_to_tecplot.py` to convert it to the Tecplot format when needed.
+USE_HDF5 = False
+
 
 if __name__ == '__main__':
 
@@ -27,117 +33,120 @@ if __name__ == '__main__':
     name_job = 'Job_OHT'
     fname_mean = 'specimen-stress-field-S4R-mean.dat'
     fname_3D = 'specimen-stress-field-S4R.dat'
+    fname_h5 = 'specimen-stress-field-S4R.h5'
 
-    odb = OdbOperation(name_job)
-    
-    def get_element_values_on_set(name_instance, name_set):
-        '''
-        Get the variable value of elements in a set of an instance.
+    with OdbOperation(name_job) as odb:
         
-        Parameters
-        --------------
-        name_instance: str
-            name of the instance in CAPITAL letters, e.g., 'PLATE'.
+        def get_element_values_on_set(name_instance, name_set):
+            '''
+            Get the variable value of elements in a set of an instance.
             
-        name_set: str
-            name of the set in CAPITAL letters, e.g., 'FACE_HOLE'.
+            Parameters
+            --------------
+            name_instance: str
+                name of the instance in CAPITAL letters, e.g., 'PLATE'.
+                
+            name_set: str
+                name of the set in CAPITAL letters, e.g., 'FACE_HOLE'.
+                
+            Returns
+            --------------
+            indices_fieldOutput: list[int]
+                indices of the elements in the fieldOutput.
+                
+            coordinates: ndarray [n_element, n_dim]
+                the coordinates of the elements.
+                
+            S_mean: ndarray [n_element, 3]
+                the element-wise stress (S11, S22, S12) of the elements.
+                
+            S_thickness: ndarray [n_element, n_thickness, 3]
+                the thickness-direction-distributed stress (S11, S22, S12) of the elements.
+                
+            thickness_distribution: ndarray [n_thickness]
+                the thickness coordinates of the thickness-direction-distributed data.
+            '''
+            element_labels, indices_fieldOutput = odb.get_element_labels_and_indices(name_instance, name_set)
             
-        Returns
-        --------------
-        indices_fieldOutput: list[int]
-            indices of the elements in the fieldOutput.
+            # Element-wise coordinate: ndarray [n_element, n_dim], i.e., [(x, y, z), ...].
+            coordinates = odb.probe_element_center_coordinate(name_instance=name_instance, element_label=element_labels)
             
-        coordinates: ndarray [n_element, n_dim]
-            the coordinates of the elements.
+            # Element-wise data: ndarray [n_element, 3], i.e., [(S11, S22, S12), ...].
+            S_mean = odb.probe_element_values_multi(variable='S', components=('S11','S22','S12'), index_fieldOutput=indices_fieldOutput)
             
-        data: Dict[str, ndarray]
-            the data of the elements.
-            The key is the variable name, e.g., 'S11', 'S22', 'S12'.
-            The value is the value of the variable, i.e., ndarray [n_element] or [n_element, n_thickness].
-            The 'thickness_distribution' is the thickness coordinates of the thickness-direction-distributed data,
-            ndarray [n_thickness].
-        '''
-        element_labels, indices_fieldOutput = odb.get_element_labels_and_indices(name_instance, name_set)
-        
-        # Element-wise coordinate: ndarray [n_element, n_dim], i.e., [(x, y, z), ...].
-        coordinates = odb.probe_element_center_coordinate(name_instance=name_instance, element_label=element_labels)
-        
-        # Element-wise data: ndarray [n_element, 1], i.e., [(comp1,), ...].
-        values_S11 = odb.probe_element_values(variable='S', component='S11', index_fieldOutput=indices_fieldOutput)
-        values_S22 = odb.probe_element_values(variable='S', component='S22', index_fieldOutput=indices_fieldOutput)
-        values_S12 = odb.probe_element_values(variable='S', component='S12', index_fieldOutput=indices_fieldOutput)
-        
-        # Thickness-direction-distributed data: ndarray [n_element, n_thickness, 2], i.e., [[(coordinate, value), ...], ...].
-        values_thickness_S11 = odb.probe_shell_element_thickness_values(variable='S', component='S11', name_instance=name_instance, element_label=element_labels)
-        values_thickness_S22 = odb.probe_shell_element_thickness_values(variable='S', component='S22', name_instance=name_instance, element_label=element_labels)
-        values_thickness_S12 = odb.probe_shell_element_thickness_values(variable='S', component='S12', name_instance=name_instance, element_label=element_labels)
-        
-        data = {
-            'S11': values_S11[:,0],
-            'S22': values_S22[:,0],
-            'S12': values_S12[:,0],
-            'thickness_S11': values_thickness_S11[:,:,1],
-            'thickness_S22': values_thickness_S22[:,:,1],
-            'thickness_S12': values_thickness_S12[:,:,1],
-            'thickness_distribution': values_thickness_S11[0,:,0]
-        }
+            # Thickness-direction-distributed data: ndarray [n_thickness] and [n_element, n_thickness, 3], i.e., [[(S11, S22, S12), ...], ...].
+            thickness_distribution, S_thickness = odb.probe_shell_element_thickness_values_multi(variable='S', components=('S11','S22','S12'), name_instance=name_instance, element_label=element_labels)
+            
+            return indices_fieldOutput, coordinates, S_mean, S_thickness, thickness_distribution
+
+
+        #* Output files are kept open (with a large buffer) for all sets
+        f_mean = open(fname_mean, 'w', buffering=1024*1024)
+        f_mean.write('Variables= X Y Z S11 S22 S12 index\n')
         
-        return indices_fieldOutput, coordinates, data
+        if USE_HDF5:
+            import h5py
+            f_h5 = h5py.File(fname_h5, 'w')
+        else:
+            f_3D = open(fname_3D, 'w', buffering=1024*1024)
+            f_3D.write('Variables= X Y Z thickness S11 S22 S12 index index_thickness\n')
 
+        for name_instance, name_sets in SET_NAME:
+            for name_set in name_sets:
+                
+                t1 = time.time()
+                name_zone = 'zone T=" %s %s "'%(name_instance, name_set)
+                
+                print('>>> ==========================================')
+                print('>>> '+name_zone)
+                
+                indices_fieldOutput, coordinates, S_mean, S_thickness, thickness_distribution = \
+                    get_element_values_on_set(name_instance, name_set)
 
-    f = open(fname_mean, 'w')
-    f.write('Variables= X Y Z S11 S22 S12 index\n')
-    f.close()
-    
-    f = open(fname_3D, 'w')
-    f.write('Variables= X Y Z thickness S11 S22 S12 index index_thickness\n')
-    f.close()
+                n_element = len(indices_fieldOutput)
+                n_thickness = len(thickness_distribution)
+                
+                #* Write mean stress field
+                f_mean.write(name_zone+' \n')
+                
+                array = np.column_stack([coordinates, S_mean, indices_fieldOutput])
+                
+                write_formatted_rows(f_mean, array, ' %14.6E'*6+' %d')
+                f_mean.write('\n')
 
-    for name_instance, name_sets in SET_NAME:
-        for name_set in name_sets:
-            
-            t1 = time.time()
-            name_zone = 'zone T=" %s %s "'%(name_instance, name_set)
-            
-            print('>>> ==========================================')
-            print('>>> '+name_zone)
-            
-            indices_fieldOutput, coordinates, data = \
-                get_element_values_on_set(name_instance, name_set)
+                #* Write 3D stress field
+                assert S_thickness.shape == (n_element, n_thickness, 3)
+                
+                if USE_HDF5:
+                    
+                    group = f_h5.create_group('%s/%s'%(name_instance, name_set))
+                    group.create_dataset('coordinates', data=coordinates)
+                    group.create_dataset('thickness', data=thickness_distribution)
+                    group.create_dataset('S', data=S_thickness)
+                    group.create_dataset('index', data=np.asarray(indices_fieldOutput, dtype=np.int64))
+                
+                else:
+                
+                    f_3D.write(name_zone+' \n')
+                    
+                    #* Element-major order: coordinates are repeated for each thickness point,
+                    #* which matches the C-order reshape of the [n_element, n_thickness, 3] values
+                    array = np.column_stack([
+                        np.repeat(coordinates, n_thickness, axis=0),
+                        np.tile(thickness_distribution, n_element),
+                        S_thickness.reshape(-1, 3),
+                        np.repeat(indices_fieldOutput, n_thickness),
+                        np.tile(np.arange(n_thickness), n_element)])
+                    
+                    write_formatted_rows(f_3D, array, ' %14.6E'*7+' %d %d')
+                
+                t2 = time.time()
+                print('>>> Number of element: %d, Time = %.2f s'%(n_element, (t2-t1)))
+                print(' ')
 
-            n_element = len(indices_fieldOutput)
-            
-            thickness_distribution = data['thickness_distribution']
-            n_thickness = len(thickness_distribution)
-            
-            #* Write mean stress field
-            with open(fname_mean, 'a') as f:
-                f.write(name_zone+' \n')
-                for i in range(n_element):
-                    for j in range(3):
-                        f.write(' %14.6E'%(coordinates[i][j]))
-                    f.write(' %14.6E'%(data['S11'][i]))
-                    f.write(' %14.6E'%(data['S22'][i]))
-                    f.write(' %14.6E'%(data['S12'][i]))
-                    f.write(' %d'%(indices_fieldOutput[i]))
-                    f.write('\n')
-                f.write('\n')
-
-            #* Write 3D stress field
-            with open(fname_3D, 'a') as f:
-                f.write(name_zone+' \n')
-                for i in range(n_element):
-                    for k in range(n_thickness):
-                        for j in range(3):
-                            f.write(' %14.6E'%(coordinates[i][j]))
-                        f.write(' %14.6E'%(thickness_distribution[k]))
-                        f.write(' %14.6E'%(data['thickness_S11'][i,k]))
-                        f.write(' %14.6E'%(data['thickness_S22'][i,k]))
-                        f.write(' %14.6E'%(data['thickness_S12'][i,k]))
-                        f.write(' %d'%(indices_fieldOutput[i]))
-                        f.write(' %d'%(k))
-                        f.write('\n')
-            
-            t2 = time.time()
-            print('>>> Number of element: %d, Time = %.2f s'%(n_element, (t2-t1)))
-            print(' ')
+        f_mean.close()
+        
+        if USE_HDF5:
+            f_h5.close()
+        else:
+            f_3D.close()
@@ -0,0 +1,65 @@
+'''
+Convert the HDF5 stress field written by `extract-data-S4R.py` (with `USE_HDF5 = True`)
+to the Tecplot format:
+
+    X Y Z thickness S11 S22 S12 index index_thickness
+
+Each group `instance/set` in the HDF5 file becomes a zone.
+
+>>> python h5_to_tecplot.py [fname_h5] [fname_dat]
+'''
+import sys
+import numpy as np
+import h5py
+
+
+def convert(fname_h5, fname_dat):
+    '''
+    Convert a HDF5 stress field file to a Tecplot file.
+
+    Parameters
+    --------------
+    fname_h5: str
+        name of the HDF5 file.
+
+    fname_dat: str
+        name of the Tecplot file.
+    '''
+    with h5py.File(fname_h5, 'r') as h, open(fname_dat, 'w', buffering=1024*1024) as f:
+
+        f.write('Variables= X Y Z thickness S11 S22 S12 index index_thickness\n')
+
+        for name_instance in h.keys():
+            for name_set in h[name_instance].keys():
+
+                group = h[name_instance][name_set]
+
+                coordinates = group['coordinates'][()]
+                thickness   = group['thickness'][()]
+                S           = group['S'][()]
+                indices     = group['index'][()]
+
+                n_element, n_thickness, _ = S.shape
+
+                array = np.column_stack([
+                    np.repeat(coordinates, n_thickness, axis=0),
+                    np.tile(thickness, n_element),
+                    S.reshape(-1, 3),
+                    np.repeat(indices, n_thickness),
+                    np.tile(np.arange(n_thickness), n_element)])
+
+                f.write('zone T=" %s %s " \n'%(name_instance, name_set))
+                np.savetxt(f, array, fmt=' %14.6E'*7+' %d %d')
+
+
+if __name__ == '__main__':
+
+    fname_h5  = 'specimen-stress-field-S4R.h5'
+    fname_dat = 'specimen-stress-field-S4R.dat'
+
+    if len(sys.argv) > 1:
+        fname_h5 = sys.argv[1]
+    if len(sys.argv) > 2:
+        fname_dat = sys.argv[2]
+
+    convert(fname_h5, fname_dat)
@@ -1,8 +1,7 @@
 
-import os
 import time
 
-from AbaqusTools.functions import clean_pyc_files, clean_temporary_files
+from AbaqusTools.functions import clean_pyc_files, clean_temporary_files, run_abaqus_command
 
 
 N_CPU = 4
@@ -19,16 +18,13 @@ if __name__ == '__main__':
     
     name_job = 'Job_OHT'
     
-    os.system('abaqus cae noGUI=open-hole-compression.py')
+    run_abaqus_command(['cae', 'noGUI=open-hole-compression.py'])
     
-    clean_temporary_files()
-    
-    os.system('abaqus interactive job=%s cpus=%d'%(name_job, N_CPU))
-    
-    clean_temporary_files()
+    run_abaqus_command(['interactive', 'job=%s'%(name_job), 'cpus=%d'%(N_CPU)])
     
-    os.system('abaqus cae noGUI=extract-data-S4R.py')
+    run_abaqus_command(['cae', 'noGUI=extract-data-S4R.py'])
     
+    #* Temporary files of all stages are cleaned once at the end
     clean_temporary_files()
 
     t2 = time.time()
@@ -2,8 +2,10 @@
 Extract data from the *.odb file.
 '''
 import time
+import numpy as np
 
 from AbaqusTools import OdbOperation
+from AbaqusTools.functions import write_formatted_rows
 
 try:
 
@@ -27,90 +29,81 @@ if __name__ == '__main__':
     name_job = 'Job_OHT'
     fname_3D = 'specimen-stress-field-SC8R.dat'
 
-    odb = OdbOperation(name_job)
-    
-    def get_element_values_on_set(name_instance, name_set):
-        '''
-        Get the variable value of elements in a set of an instance.
+    with OdbOperation(name_job) as odb:
         
-        Parameters
-        --------------
-        name_instance: str
-            name of the instance in CAPITAL letters, e.g., 'PLATE'.
+        def get_element_values_on_set(name_instance, name_set):
+            '''
+            Get the variable value of elements in a set of an instance.
             
-        name_set: str
-            name of the set in CAPITAL letters, e.g., 'FACE_HOLE'.
+            Parameters
+            --------------
+            name_instance: str
+                name of the instance in CAPITAL letters, e.g., 'PLATE'.
+                
+            name_set: str
+                name of the set in CAPITAL letters, e.g., 'FACE_HOLE'.
+                
+            Returns
+            --------------
+            indices_fieldOutput: list[int]
+                indices of the elements in the fieldOutput.
+                
+            coordinates: ndarray [n_element, n_dim]
+                the coordinates of the elements.
+                
+            S_thickness: ndarray [n_element, n_thickness, 3]
+                the thickness-direction-distributed stress (S11, S22, S12) of the elements.
+                
+            thickness_distribution: ndarray [n_thickness]
+                the thickness coordinates of the thickness-direction-distributed data.
+            '''
+            element_labels, indices_fieldOutput = odb.get_element_labels_and_indices(name_instance, name_set)
             
-        Returns
-        --------------
-        indices_fieldOutput: list[int]
-            indices of the elements in the fieldOutput.
+            # Element-wise coordinate: ndarray [n_element, n_dim], i.e., [(x, y, z), ...].
+            coordinates = odb.probe_element_center_coordinate(name_instance=name_instance, element_label=element_labels)
             
-        coordinates: ndarray [n_element, n_dim]
-            the coordinates of the elements.
+            # Thickness-direction-distributed data: ndarray [n_thickness] and [n_element, n_thickness, 3], i.e., [[(S11, S22, S12), ...], ...].
+            thickness_distribution, S_thickness = odb.probe_shell_element_thickness_values_multi(variable='S', components=('S11','S22','S12'), name_instance=name_instance, element_label=element_labels)
             
-        data: Dict[str, ndarray]
-            the data of the elements.
-            The key is the variable name, e.g., 'S11', 'S22', 'S12'.
-            The value is the value of the variable, i.e., ndarray [n_element] or [n_element, n_thickness].
-            The 'thickness_distribution' is the thickness coordinates of the thickness-direction-distributed data,
-            ndarray [n_thickness].
-        '''
-        element_labels, indices_fieldOutput = odb.get_element_labels_and_indices(name_instance, name_set)
-        
-        # Element-wise coordinate: ndarray [n_element, n_dim], i.e., [(x, y, z), ...].
-        coordinates = odb.probe_element_center_coordinate(name_instance=name_instance, element_label=element_labels)
-        
-        # Thickness-direction-distributed data: ndarray [n_element, n_thickness, 2], i.e., [[(coordinate, value), ...], ...].
-        values_thickness_S11 = odb.probe_shell_element_thickness_values(variable='S', component='S11', name_instance=name_instance, element_label=element_labels)
-        values_thickness_S22 = odb.probe_shell_element_thickness_values(variable='S', component='S22', name_instance=name_instance, element_label=element_labels)
-        values_thickness_S12 = odb.probe_shell_element_thickness_values(variable='S', component='S12', name_instance=name_instance, element_label=element_labels)
-        
-        data = {
-            'thickness_S11': values_thickness_S11[:,:,1],
-            'thickness_S22': values_thickness_S22[:,:,1],
-            'thickness_S12': values_thickness_S12[:,:,1],
-            'thickness_distribution': values_thickness_S11[0,:,0]
-        }
-        
-        return indices_fieldOutput, coordinates, data
+            return indices_fieldOutput, coordinates, S_thickness, thickness_distribution
 
-    f = open(fname_3D, 'w')
-    f.write('Variables= X Y Z thickness S11 S22 S12 index index_thickness\n')
-    f.close()
+        #* Output file is kept open (with a large buffer) for all sets
+        f_3D = open(fname_3D, 'w', buffering=1024*1024)
+        f_3D.write('Variables= X Y Z thickness S11 S22 S12 index index_thickness\n')
 
-    for name_instance, name_sets in SET_NAME:
-        for name_set in name_sets:
-            
-            t1 = time.time()
-            name_zone = 'zone T=" %s %s "'%(name_instance, name_set)
-            
-            print('>>> ==========================================')
-            print('>>> '+name_zone)
-            
-            indices_fieldOutput, coordinates, data = \
-                get_element_values_on_set(name_instance, name_set)
+        for name_instance, name_sets in SET_NAME:
+            for name_set in name_sets:
+                
+                t1 = time.time()
+                name_zone = 'zone T=" %s %s "'%(name_instance, name_set)
+                
+                print('>>> ==========================================')
+                print('>>> '+name_zone)
+                
+                indices_fieldOutput, coordinates, S_thickness, thickness_distribution = \
+                    get_element_values_on_set(name_instance, name_set)
 
-            n_element = len(indices_fieldOutput)
-            
-            thickness_distribution = data['thickness_distribution']
-            n_thickness = len(thickness_distribution)
-            
-            #* Write 3D stress field
-            with open(fname_3D, 'a') as f:
-                f.write(name_zone+' \n')
-                for i in range(n_element):
-                    for k in range(n_thickness):
-                        for j in range(3):
-                            f.write(' %14.6E'%(coordinates[i][j]))
-                        f.write(' %14.6E'%(thickness_distribution[k]))
-                        f.write(' %14.6E'%(data['thickness_S11'][i,k]))
-                        f.write(' %14.6E'%(data['thickness_S22'][i,k]))
-                        f.write(' %14.6E'%(data['thickness_S12'][i,k]))
-                        f.write(' %d'%(indices_fieldOutput[i]))
-                        f.write(' %d'%(k))
-                        f.write('\n')
-            
-            t2 = time.time()
-            print('>>> Number of element: %d, Time = %.2f s'%(n_element, (t2-t1)))
-            print(' ')
+                n_element = len(indices_fieldOutput)
+                n_thickness = len(thickness_distribution)
+                
+                #* Write 3D stress field
+                f_3D.write(name_zone+' \n')
+                
+                #* Element-major order: coordinates are repeated for each thickness point,
+                #* which matches the C-order reshape of the [n_element, n_thickness, 3] values
+                assert S_thickness.shape == (n_element, n_thickness, 3)
+                
+                array = np.column_stack([
+                    np.repeat(coordinates, n_thickness, axis=0),
+                    np.tile(thickness_distribution, n_element),
+                    S_thickness.reshape(-1, 3),
+                    np.repeat(indices_fieldOutput, n_thickness),
+                    np.tile(np.arange(n_thickness), n_element)])
+                
+                write_formatted_rows(f_3D, array, ' %14.6E'*7+' %d %d')
+                
+                t2 = time.time()
+                print('>>> Number of element: %d, Time = %.2f s'%(n_element, (t2-t1)))
+                print(' ')
+
+        f_3D.close()
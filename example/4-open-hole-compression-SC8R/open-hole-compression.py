@@ -9,6 +9,7 @@ Open Hole Compression Test of a Composite Plate using Abaqus/CAE Python Scriptin
 '''
 import os
 import time
+import itertools
 import numpy as np
 from AbaqusTools import Part, IS_ABAQUS
 
@@ -645,20 +646,20 @@ if __name__ == '__main__':
         
         if os.path.exists('input.txt'):
             
+            #* Second column of the first 8 `name value` lines, as Python floats
             with open('input.txt', 'r') as f:
-                
-                lines = f.readlines()
-                
-                pGeo['len_x_plate'] = float(lines[0].split()[1])
-                pGeo['len_y_plate'] = float(lines[1].split()[1])
-                pGeo['thk_z_plate'] = float(lines[2].split()[1])
-                pGeo['xr_hole_center'] = float(lines[3].split()[1])
-                pGeo['yr_hole_center'] = float(lines[4].split()[1])
-                pGeo['r_hole'] = float(lines[5].split()[1])
-                
-                strain = float(lines[6].split()[1])
-                
-                index_layup = int(float(lines[7].split()[1]))
+                values = np.loadtxt(itertools.islice(f, 8), usecols=(1,)).tolist()
+            
+            pGeo['len_x_plate'] = values[0]
+            pGeo['len_y_plate'] = values[1]
+            pGeo['thk_z_plate'] = values[2]
+            pGeo['xr_hole_center'] = values[3]
+            pGeo['yr_hole_center'] = values[4]
+            pGeo['r_hole'] = values[5]
+            
+            strain = values[6]
+            
+            index_layup = int(values[7])
                 
             #* Update parameters
             
@@ -225,19 +225,24 @@ class TestModel_PBC_3D(OpenHolePlateModel):
                 amplitude=UNSET, fixed=OFF, distributionType=UNIFORM, fieldName='', localCsys=None)
 
 
-if __name__ == '__main__':
-
-
-    with open('parameters.json', 'r') as f:
-        parameters = json.load(f)
-
+def run_strain_vector(parameters, index_strain_vector):
+    '''
+    Build the model, run the job and write the reaction forces of one strain vector.
+    
+    Parameters
+    ---------------
+    parameters: dict
+        parameters of the run, i.e., the content of `parameters.json`.
+        
+    index_strain_vector: int
+        index of the strain vector, 0~5.
+    '''
     pGeo = parameters['pGeo']
     pMesh = parameters['pMesh']
     pRun = parameters['pRun']
     
     index_run = parameters['index_run']
-    index_strain_vector = parameters['index_strain_vector']
-
+    
     print('>>> ')
     print('>>> Strain component: %d'%(index_strain_vector))
     print('>>> ')
@@ -292,5 +297,28 @@ if __name__ == '__main__':
                     f.write('%s_U   %20.6E \n'%(label_rp, u_RPs[i_rp]))
 
                 f.write('Strain_%d  %20.6E \n'%(index_strain_vector, model.strain_scale))
-                
-                
\ No newline at end of file
+
+
+if __name__ == '__main__':
+
+
+    with open('parameters.json', 'r') as f:
+        parameters = json.load(f)
+
+    #* The index of the strain vector can be given after `--` in the command line, 
+    #* e.g., `abaqus cae noGUI=job-pbc-3d.py -- 0`.
+    #* Otherwise, all strain vectors in `strain_vectors` run in this CAE session.
+    if sys.argv[-1].isdigit():
+        strain_vectors = [int(sys.argv[-1])]
+    elif 'strain_vectors' in parameters.keys():
+        strain_vectors = parameters['strain_vectors']
+    else:
+        strain_vectors = [parameters['index_strain_vector']]
+
+    for i, index_strain_vector in enumerate(strain_vectors):
+        
+        #* Start from a new model database for each strain vector
+        if i > 0:
+            Mdb()
+        
+        run_strain_vector(parameters, index_strain_vector)
@@ -3,6 +3,7 @@ Steel plate (in x-y plane) with an open hole in the center.
 '''
 import json
 import time
+import math
 import numpy as np
 from AbaqusTools import IS_ABAQUS
 
@@ -15,6 +16,12 @@ if IS_ABAQUS:
 from AbaqusTools import Part, Model
 
 
+SQRT2_HALF = math.sqrt(2)*0.5
+
+#* Angles (from the y axis) of the radial partition edges around the hole: 45, 135, 225, 315 degree
+SIN_HOLE_RADIAL_ANGLES = [math.sin(0.25*math.pi*(2*i+1)) for i in range(4)]
+COS_HOLE_RADIAL_ANGLES = [math.cos(0.25*math.pi*(2*i+1)) for i in range(4)]
+
 class OpenHolePlate(Part):
     '''
     Plate (in x-y plane) with an open hole in the center.
@@ -39,6 +46,16 @@ class OpenHolePlate(Part):
             xc_hole=self.xc_hole, yc_hole=self.yc_hole,
             radius_ratio_partition_circle=self.pMesh['radius_ratio_partition_circle'])
 
+        #* Sets (name, point, geometry), and the point of each set by name
+        self._set_specs = self._cal_set_specs()
+        self._set_points = dict((name, point) for name, point, _ in self._set_specs)
+
+        #* Points (x, y) on the edges around the hole for seeding
+        self._hole_points_radial, self._hole_points_circumferential = self._cal_hole_edge_points()
+
+        #* Abaqus part object, created in `create_part`
+        self.myPrt = None
+
     def build(self):
         '''
         Build an Abaqus part:
@@ -122,31 +139,28 @@ class OpenHolePlate(Part):
         Create the sketch in X-Y plane.
         '''
         #* Sketch points in X-Y plane (a rectangle)
-        sketch_points = np.zeros((4,2))
-        sketch_points[0,:] = [0.0,        0.0]
-        sketch_points[1,:] = [self.len_x, 0.0]
-        sketch_points[2,:] = [self.len_x, self.len_y]
-        sketch_points[3,:] = [0.0,        self.len_y]
+        sketch_points = [(0.0,        0.0),
+                         (self.len_x, 0.0),
+                         (self.len_x, self.len_y),
+                         (0.0,        self.len_y)]
 
         #* Create the open-hole plate sketch in x-y plane
         mySkt = self.model.ConstrainedSketch(name='plate_top_view', sheetSize=200)
         
         for i in range(4):
-            mySkt.Line(point1=tuple(sketch_points[i-1,:]),
-                       point2=tuple(sketch_points[i,:]))
+            mySkt.Line(point1=sketch_points[i-1], point2=sketch_points[i])
 
-        o0 = np.array([self.xc_hole, self.yc_hole])
-        dd = np.array([self.r_hole, self.r_hole]) * np.sqrt(2)*0.5
-        mySkt.CircleByCenterPerimeter(center=tuple(o0),
-                                      point1=tuple(o0+dd))
+        o0 = (self.xc_hole, self.yc_hole)
+        dd = self.r_hole*SQRT2_HALF
+        mySkt.CircleByCenterPerimeter(center=o0,
+                                      point1=(o0[0]+dd, o0[1]+dd))
         
         #* Create the partition circle-square sketch in x-y plane
         mySkt = self.model.ConstrainedSketch(name='partition_top_view', sheetSize=200)
         
-        o0 = np.array([self.xc_hole, self.yc_hole])
-        dd = np.array([self.r_partition, self.r_partition]) * np.sqrt(2)*0.5
-        mySkt.CircleByCenterPerimeter(center=tuple(o0), 
-                                      point1=tuple(o0+dd))
+        dd = self.r_partition*SQRT2_HALF
+        mySkt.CircleByCenterPerimeter(center=o0, 
+                                      point1=(o0[0]+dd, o0[1]+dd))
 
     def create_part(self):
         '''
@@ -154,28 +168,31 @@ class OpenHolePlate(Part):
         '''
         #* Create part
         myPrt = self.model.Part(name=self.name_part, dimensionality=THREE_D, type=DEFORMABLE_BODY)
+        self.myPrt = myPrt
     
         #* Reference plane and axis
-        myPrt.DatumPlaneByPrincipalPlane(principalPlane=XYPLANE, offset=0.0)
+        feature = myPrt.DatumPlaneByPrincipalPlane(principalPlane=XYPLANE, offset=0.0)
         self.rename_feature(myPrt, 'XYPLANE')
+        self._datum_ids['XYPLANE'] = feature.id
         
-        myPrt.DatumAxisByPrincipalAxis(principalAxis=XAXIS)
+        feature = myPrt.DatumAxisByPrincipalAxis(principalAxis=XAXIS)
         self.rename_feature(myPrt, 'XAXIS')
+        self._datum_ids['XAXIS'] = feature.id
         
-        myPrt.DatumAxisByPrincipalAxis(principalAxis=YAXIS)
+        feature = myPrt.DatumAxisByPrincipalAxis(principalAxis=YAXIS)
         self.rename_feature(myPrt, 'YAXIS')
+        self._datum_ids['YAXIS'] = feature.id
         
-        myPrt.DatumAxisByPrincipalAxis(principalAxis=ZAXIS)
+        feature = myPrt.DatumAxisByPrincipalAxis(principalAxis=ZAXIS)
         self.rename_feature(myPrt, 'ZAXIS')
+        self._datum_ids['ZAXIS'] = feature.id
         
         self.create_datum_csys_3p(myPrt, 'csys_plate', origin=[0.0, 0.0, 0.0],
                                     dx=[1, 0, 0], dy=[0, 1, 0])
+        self._datum_ids['csys_plate'] = myPrt.features['csys_plate'].id
         
         #* Plane for plate sketch
-        transform = myPrt.MakeSketchTransform(
-            sketchPlane=self.get_datum_by_name(myPrt, 'XYPLANE'),
-            sketchUpEdge=self.get_datum_by_name(myPrt, 'XAXIS'), 
-            sketchPlaneSide=SIDE1, sketchOrientation=BOTTOM, origin=(0.0, 0.0, 0.0))
+        transform = self._sketch_transform_xy(myPrt)
     
         #* Section sketch
         mySkt = self.model.ConstrainedSketch(name='__profile__', sheetSize=200, transform=transform)
@@ -196,34 +213,25 @@ class OpenHolePlate(Part):
      
     def create_surface(self):
         
-        pt_x = 0.5*(self.xc_hole - self.r_hole)
-        pt_y = 0.5*(self.yc_hole - self.r_hole)
-        
-        myPrt = self.model.parts[self.name_part]
+        myPrt = self.myPrt
 
-        faces = self.get_faces(myPrt, (0, 0.5*self.len_y, 0.5*self.len_z))
-        myPrt.Surface(side1Faces=faces, name='face_x0')
-        
-        faces = self.get_faces(myPrt, (self.len_x, 0.5*self.len_y, 0.5*self.len_z))
-        myPrt.Surface(side1Faces=faces, name='face_x1')
-
-        faces = self.get_faces(myPrt, (0.5*self.len_x, 0.0, 0.5*self.len_z))
-        myPrt.Surface(side1Faces=faces, name='face_y0')
-        
-        faces = self.get_faces(myPrt, (0.5*self.len_x, self.len_y, 0.5*self.len_z))
-        myPrt.Surface(side1Faces=faces, name='face_y1')
-        
-        faces = self.get_faces(myPrt, (pt_x, pt_y, 0.0))
-        myPrt.Surface(side1Faces=faces, name='face_z0')
-        
-        faces = self.get_faces(myPrt, (pt_x, pt_y, self.len_z))
-        myPrt.Surface(side1Faces=faces, name='face_z1')
-        
-        faces = self.get_faces(myPrt, (self.xc_hole + self.r_hole, self.yc_hole, 0.5*self.len_z))
-        myPrt.Surface(side1Faces=faces, name='face_hole')
+        for name in ['face_x0', 'face_x1', 'face_y0', 'face_y1', 'face_z0', 'face_z1', 'face_hole']:
+            faces = self.get_faces(myPrt, self._set_points[name])
+            myPrt.Surface(side1Faces=faces, name=name)
 
     def create_set(self):
-        
+
+        myPrt = self.myPrt
+        myPrt.Set(cells=myPrt.cells, name='all') 
+
+        for name, point, geometry in self._set_specs:
+            self.create_geometry_set(name, point, geometry=geometry)
+
+    def _cal_set_specs(self):
+        '''
+        Calculate the (name, point, geometry) of the sets of the part.
+        The point is used by `findAt` to find the geometry of the set.
+        '''
         xc_hole = self.xc_hole
         yc_hole = self.yc_hole
         r_hole = self.r_hole
@@ -232,44 +240,45 @@ class OpenHolePlate(Part):
         lz = self.len_z
         pt_x = 0.5*(xc_hole - r_hole)
         pt_y = 0.5*(yc_hole - r_hole)
-
-        myPrt = self.model.parts[self.name_part]
-        myPrt.Set(cells=myPrt.cells, name='all') 
-
-        self.create_geometry_set('face_x0', (0.0,    0.5*ly, 0.5*lz), geometry='face')
-        self.create_geometry_set('face_x1', (lx,     0.5*ly, 0.5*lz), geometry='face')
-        self.create_geometry_set('face_y0', (0.5*lx, 0.0,    0.5*lz), geometry='face')
-        self.create_geometry_set('face_y1', (0.5*lx, ly,     0.5*lz), geometry='face')
-        self.create_geometry_set('face_z0', (pt_x,   pt_y,   0.0   ), geometry='face')
-        self.create_geometry_set('face_z1', (pt_x,   pt_y,   lz    ), geometry='face')
-        self.create_geometry_set('face_hole', (xc_hole + r_hole, yc_hole, 0.5*lz), geometry='face')
-
-        self.create_geometry_set('edge_x_y0z0', (0.5*lx, 0.0, 0.0), geometry='edge')
-        self.create_geometry_set('edge_x_y1z0', (0.5*lx, ly,  0.0), geometry='edge')
-        self.create_geometry_set('edge_x_y0z1', (0.5*lx, 0.0, lz ), geometry='edge')
-        self.create_geometry_set('edge_x_y1z1', (0.5*lx, ly,  lz ), geometry='edge')
-
-        self.create_geometry_set('edge_y_z0x0', (0.0, 0.5*ly, 0.0), geometry='edge')
-        self.create_geometry_set('edge_y_z1x0', (0.0, 0.5*ly, lz ), geometry='edge')
-        self.create_geometry_set('edge_y_z0x1', (lx,  0.5*ly, 0.0), geometry='edge')
-        self.create_geometry_set('edge_y_z1x1', (lx,  0.5*ly, lz ), geometry='edge')
-
-        self.create_geometry_set('edge_z_x0y0', (0.0, 0.0, 0.5*lz), geometry='edge')
-        self.create_geometry_set('edge_z_x1y0', (lx,  0.0, 0.5*lz), geometry='edge')
-        self.create_geometry_set('edge_z_x0y1', (0.0, ly,  0.5*lz), geometry='edge')
-        self.create_geometry_set('edge_z_x1y1', (lx,  ly,  0.5*lz), geometry='edge')
-        
-        self.create_geometry_set('edge_hole_z0', (xc_hole + r_hole, yc_hole, 0.0), geometry='edge')
-        self.create_geometry_set('edge_hole_z1', (xc_hole + r_hole, yc_hole, lz ), geometry='edge')
-
-        self.create_geometry_set('vertex_000', (0.0, 0.0, 0.0), geometry='vertex')
-        self.create_geometry_set('vertex_100', (lx,  0.0, 0.0), geometry='vertex')
-        self.create_geometry_set('vertex_010', (0.0, ly,  0.0), geometry='vertex')
-        self.create_geometry_set('vertex_110', (lx,  ly,  0.0), geometry='vertex')
-        self.create_geometry_set('vertex_001', (0.0, 0.0, lz ), geometry='vertex')
-        self.create_geometry_set('vertex_101', (lx,  0.0, lz ), geometry='vertex')
-        self.create_geometry_set('vertex_011', (0.0, ly,  lz ), geometry='vertex')
-        self.create_geometry_set('vertex_111', (lx,  ly,  lz ), geometry='vertex')
+        
+        specs = (
+            ('face_x0', (0.0,    0.5*ly, 0.5*lz), 'face'),
+            ('face_x1', (lx,     0.5*ly, 0.5*lz), 'face'),
+            ('face_y0', (0.5*lx, 0.0,    0.5*lz), 'face'),
+            ('face_y1', (0.5*lx, ly,     0.5*lz), 'face'),
+            ('face_z0', (pt_x,   pt_y,   0.0   ), 'face'),
+            ('face_z1', (pt_x,   pt_y,   lz    ), 'face'),
+            ('face_hole', (xc_hole + r_hole, yc_hole, 0.5*lz), 'face'),
+
+            ('edge_x_y0z0', (0.5*lx, 0.0, 0.0), 'edge'),
+            ('edge_x_y1z0', (0.5*lx, ly,  0.0), 'edge'),
+            ('edge_x_y0z1', (0.5*lx, 0.0, lz ), 'edge'),
+            ('edge_x_y1z1', (0.5*lx, ly,  lz ), 'edge'),
+
+            ('edge_y_z0x0', (0.0, 0.5*ly, 0.0), 'edge'),
+            ('edge_y_z1x0', (0.0, 0.5*ly, lz ), 'edge'),
+            ('edge_y_z0x1', (lx,  0.5*ly, 0.0), 'edge'),
+            ('edge_y_z1x1', (lx,  0.5*ly, lz ), 'edge'),
+
+            ('edge_z_x0y0', (0.0, 0.0, 0.5*lz), 'edge'),
+            ('edge_z_x1y0', (lx,  0.0, 0.5*lz), 'edge'),
+            ('edge_z_x0y1', (0.0, ly,  0.5*lz), 'edge'),
+            ('edge_z_x1y1', (lx,  ly,  0.5*lz), 'edge'),
+            
+            ('edge_hole_z0', (xc_hole + r_hole, yc_hole, 0.0), 'edge'),
+            ('edge_hole_z1', (xc_hole + r_hole, yc_hole, lz ), 'edge'),
+
+            ('vertex_000', (0.0, 0.0, 0.0), 'vertex'),
+            ('vertex_100', (lx,  0.0, 0.0), 'vertex'),
+            ('vertex_010', (0.0, ly,  0.0), 'vertex'),
+            ('vertex_110', (lx,  ly,  0.0), 'vertex'),
+            ('vertex_001', (0.0, 0.0, lz ), 'vertex'),
+            ('vertex_101', (lx,  0.0, lz ), 'vertex'),
+            ('vertex_011', (0.0, ly,  lz ), 'vertex'),
+            ('vertex_111', (lx,  ly,  lz ), 'vertex'),
+        )
+        
+        return specs
     
     #* Partition and create surfaces and sets for the partition
     
@@ -278,23 +287,21 @@ class OpenHolePlate(Part):
         After `create_surface` and `create_set`,
         partition a circle and square for the structure mesh around hole.
         '''        
-        myPrt = self.model.parts[self.name_part]
+        myPrt = self.myPrt
         
         #* Partition face by sketch
-        transform = myPrt.MakeSketchTransform(
-            sketchPlane=self.get_datum_by_name(myPrt, 'XYPLANE'),
-            sketchUpEdge=self.get_datum_by_name(myPrt, 'XAXIS'), 
-            sketchPlaneSide=SIDE1, sketchOrientation=BOTTOM, origin=(0.0, 0.0, 0.0))
+        transform = self._sketch_transform_xy(myPrt)
     
         mySkt = self.model.ConstrainedSketch(name='__profile__', sheetSize=200, transform=transform)
         mySkt.sketchOptions.setValues(gridOrigin=(0.0, 0.0), gridAngle=0.0)
 
-        myPrt.projectReferencesOntoSketch(sketch=mySkt, filter=COPLANAR_EDGES)
-        
+        #* The partition circle is a closed curve inside face z=0 in absolute coordinates 
+        #* (the transform origin is the global origin), 
+        #* so the coplanar edges are not projected onto the sketch
         mySkt.retrieveSketch(sketch=self.model.sketches['partition_top_view'])
 
         myPrt.PartitionFaceBySketch(
-                sketchUpEdge=self.get_datum_by_name(myPrt, 'XAXIS'), 
+                sketchUpEdge=self._datum('XAXIS'), 
                 faces=myPrt.surfaces['face_z0'].faces,
                 sketchOrientation=BOTTOM, sketch=mySkt)
 
@@ -305,173 +312,179 @@ class OpenHolePlate(Part):
         myPrt.Set(edges=edges, name='edge_partition_circle')
         
         myPrt.PartitionCellByExtrudeEdge(
-            line=self.get_datum_by_name(myPrt, 'ZAXIS'), 
+            line=self._datum('ZAXIS'), 
             cells=myPrt.cells, edges=edges, sense=FORWARD)
         
         dd = 0.5*(self.r_partition+self.r_hole)
         cells = self.get_cells(myPrt, (self.xc_hole + dd, self.yc_hole, 0.5*self.len_z))
         myPrt.Set(cells=cells, name='partition_circle') 
         
-        #* Partition cell to squares by 4 planes
+        #* Datum planes of the partition square and its diagonals, 
+        #* each diagonal plane is used by both the circle and square partitions
         x0 = self.xc_hole - 0.5*self.width_partition
         x1 = self.xc_hole + 0.5*self.width_partition
         y0 = self.yc_hole - 0.5*self.width_partition
         y1 = self.yc_hole + 0.5*self.width_partition
         
-        myPrt.PartitionCellByPlaneThreePoints(cells=myPrt.cells, 
-            point1=(x0, y0, 0.0), point2=(x1, y0, 0.0), point3=(x0, y0, 1.0))
-        myPrt.PartitionCellByPlaneThreePoints(cells=myPrt.cells, 
-            point1=(x0, y1, 0.0), point2=(x1, y1, 0.0), point3=(x0, y1, 1.0))
-        myPrt.PartitionCellByPlaneThreePoints(cells=myPrt.cells, 
-            point1=(x0, y0, 0.0), point2=(x0, y1, 0.0), point3=(x0, y0, 1.0))
-        myPrt.PartitionCellByPlaneThreePoints(cells=myPrt.cells, 
-            point1=(x1, y0, 0.0), point2=(x1, y1, 0.0), point3=(x1, y0, 1.0))
+        planes = [
+            ('plane_y0', XZPLANE, y0),
+            ('plane_y1', XZPLANE, y1),
+            ('plane_x0', YZPLANE, x0),
+            ('plane_x1', YZPLANE, x1),
+        ]
+        
+        for name, principalPlane, offset in planes:
+            feature = myPrt.DatumPlaneByPrincipalPlane(principalPlane=principalPlane, offset=offset)
+            self.rename_feature(myPrt, name)
+            self._datum_ids[name] = feature.id
+        
+        diagonals = [
+            ('plane_diagonal_0', (x0, y0, 0.0), (x1, y1, 0.0), (x0, y0, 1.0)),
+            ('plane_diagonal_1', (x0, y1, 0.0), (x1, y0, 0.0), (x0, y1, 1.0)),
+        ]
+        
+        for name, point1, point2, point3 in diagonals:
+            feature = myPrt.DatumPlaneByThreePoints(point1=point1, point2=point2, point3=point3)
+            self.rename_feature(myPrt, name)
+            self._datum_ids[name] = feature.id
+        
+        #* Partition cell to squares by 4 planes
+        for name, _, _ in planes:
+            myPrt.PartitionCellByDatumPlane(datumPlane=self._datum(name), cells=myPrt.cells)
         
         dd = 0.5*(self.width_partition*0.5+self.r_partition)
         cells = self.get_cells(myPrt, (self.xc_hole + dd, self.yc_hole, 0.5*self.len_z))
         myPrt.Set(cells=cells, name='partition_square') 
         
         #* Partition cell by diagonal planes
-        myPrt.PartitionCellByPlaneThreePoints(cells=myPrt.sets['partition_circle'].cells, 
-            point1=(x0, y0, 0.0), point2=(x1, y1, 0.0), point3=(x0, y0, 1.0))
-        myPrt.PartitionCellByPlaneThreePoints(cells=myPrt.sets['partition_circle'].cells, 
-            point1=(x0, y1, 0.0), point2=(x1, y0, 0.0), point3=(x0, y1, 1.0))
-        
-        myPrt.PartitionCellByPlaneThreePoints(cells=myPrt.sets['partition_square'].cells, 
-            point1=(x0, y0, 0.0), point2=(x1, y1, 0.0), point3=(x0, y0, 1.0))
-        myPrt.PartitionCellByPlaneThreePoints(cells=myPrt.sets['partition_square'].cells, 
-            point1=(x0, y1, 0.0), point2=(x1, y0, 0.0), point3=(x0, y1, 1.0))
+        for name_set in ['partition_circle', 'partition_square']:
+            for name, _, _, _ in diagonals:
+                myPrt.PartitionCellByDatumPlane(datumPlane=self._datum(name), 
+                                                cells=myPrt.sets[name_set].cells)
     
     #* Meshing
     
     def set_seeding(self):
 
-        myPrt = self.model.parts[self.name_part]
+        myPrt = self.myPrt
         myPrt.seedPart(size=self.pMesh['plate_seedPart_size'], 
                         deviationFactor=0.1, minSizeFactor=0.1)
         
         myPrt.seedEdgeByNumber(edges=myPrt.sets['edge_z_x0y0'].edges, 
                                 number=self.pMesh['num_element_thickness'], constraint=FIXED)
         
-        self._seed_edge_face_hole_radial(myPrt, 0.0, reverse=False)
-        self._seed_edge_face_hole_radial(myPrt, self.len_z, reverse=True)
-        
-        self._seed_edge_face_circumferential_partition(myPrt, 0.0)
-        self._seed_edge_face_circumferential_partition(myPrt, self.len_z)
+        self._seed_edge_face_hole_radial(myPrt)
+        self._seed_edge_face_circumferential_partition(myPrt)
 
     def create_mesh(self):
         
         #* Stack direction of plate,
         #* the reference face is the top surface, the stacking direction is from bottom to top,
 
-        myPrt = self.model.parts[self.name_part]
+        myPrt = self.myPrt
         myPrt.setMeshControls(regions=myPrt.cells, elemShape=HEX)
         myPrt.assignStackDirection(referenceRegion=myPrt.surfaces['face_z1'].faces[0], cells=myPrt.cells)
         myPrt.generateMesh()
 
     def set_element_type(self):
         
-        myPrt = self.model.parts[self.name_part]
+        myPrt = self.myPrt
         self.set_element_type_of_part(myPrt, kind='3D stress')
     
     def set_section_assignment(self):
         
-        myPrt = self.model.parts[self.name_part]
+        myPrt = self.myPrt
         
         myPrt.SectionAssignment(region=myPrt.sets['all'], sectionName='Steel', offset=0.0, 
             offsetType=MIDDLE_SURFACE, offsetField='', thicknessAssignment=FROM_SECTION)
 
     #* Seeding edges on outer surfaces
 
-    def _seed_edge_face_hole_radial(self, myPrt, z, reverse=False):
+    def _cal_hole_edge_points(self):
         '''
-        Seed the edges around the hole in radial direction in one face.
+        Calculate the (x, y) of points on the edges around the hole, 
+        which are used by `findAt` to seed the edges in both faces (z=0 and z=len_z).
+        
+        Returns
+        ----------------
+        points_radial: dict
+            points on the radial edges at the four angles, {'circle': [4], 'square': [4]}
+            
+        points_circumferential: list [12]
+            points on the hole edges, partition circle edges, and partition square edges
+        '''
+        dc = 0.5*(self.r_hole + self.r_partition)
+        ds = 0.5*(self.r_partition + self.width_partition*0.5)
+        
+        points_radial = {'circle': [], 'square': []}
+        
+        for i in range(4):
+            
+            sin_i = SIN_HOLE_RADIAL_ANGLES[i]
+            cos_i = COS_HOLE_RADIAL_ANGLES[i]
+            
+            points_radial['circle'].append((self.xc_hole + dc*sin_i, self.yc_hole + dc*cos_i))
+            points_radial['square'].append((self.xc_hole + ds*sin_i, self.yc_hole + ds*cos_i))
+        
+        points_circumferential = []
+        
+        for radius in [self.r_hole, self.r_partition, 0.5*self.width_partition]:
+            points_circumferential += [
+                (self.xc_hole - radius, self.yc_hole),
+                (self.xc_hole + radius, self.yc_hole),
+                (self.xc_hole, self.yc_hole - radius),
+                (self.xc_hole, self.yc_hole + radius)]
+        
+        return points_radial, points_circumferential
+
+    def _seed_edge_face_hole_radial(self, myPrt):
+        '''
+        Seed the edges around the hole in radial direction in both faces.
         '''
         ratio_circle  = self.pMesh['circle_radial_bias_seedEdgeByBias']
         number_circle = self.pMesh['circle_radial_num_seedEdgeByBias']
         ratio_square  = self.pMesh['square_radial_bias_seedEdgeByBias']
         number_square = self.pMesh['square_radial_num_seedEdgeByBias']
 
-        ANGLE_INCREMENT= 0.25*np.pi
+        #* Bias end (end1Edges or end2Edges) of the radial edges at each angle,
+        #* which is reversed in the face z=len_z
+        faces = [(0.0,        ('end1', 'end1', 'end2', 'end2')),
+                 (self.len_z, ('end2', 'end2', 'end1', 'end1'))]
 
-        dc = 0.5*(self.r_hole + self.r_partition)
-        ds = 0.5*(self.r_partition + self.width_partition*0.5)
+        #* Points on the radial edges, grouped by {end1, end2} x {circle, square}
+        points_c = {'end1': [], 'end2': []}
+        points_s = {'end1': [], 'end2': []}
 
-        for i in range (4):
+        for z, ends in faces:
+            for i in range(4):
+                
+                x_c, y_c = self._hole_points_radial['circle'][i]
+                x_s, y_s = self._hole_points_radial['square'][i]
+                
+                points_c[ends[i]].append((x_c,y_c,z))
+                points_s[ends[i]].append((x_s,y_s,z))
+        
+        #* One seeding call for each group of edges
+        for end in ['end1', 'end2']:
             
-            angle= ANGLE_INCREMENT * (2*i+1)
+            edges_c = self.get_edges(myPrt, points_c[end], getClosest=False, batch=True)
+            edges_s = self.get_edges(myPrt, points_s[end], getClosest=False, batch=True)
             
-            x_c = self.xc_hole + dc*np.sin(angle)
-            y_c = self.yc_hole + dc*np.cos(angle)
-
-            x_s = self.xc_hole + ds*np.sin(angle)
-            y_s = self.yc_hole + ds*np.cos(angle)
+            myPrt.seedEdgeByBias(biasMethod=SINGLE, ratio=ratio_circle, number=number_circle, constraint=FIXED, 
+                                    **{end+'Edges': edges_c})
+            myPrt.seedEdgeByBias(biasMethod=SINGLE, ratio=ratio_square, number=number_square, constraint=FIXED, 
+                                    **{end+'Edges': edges_s})
 
-            edges_c = self.get_edges(myPrt, (x_c,y_c,z), getClosest=False)
-            edges_s = self.get_edges(myPrt, (x_s,y_s,z), getClosest=False)
-            
-            if not reverse:
-                
-                if i in [0, 1]:
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end1Edges=edges_c, ratio=ratio_circle, number=number_circle, constraint=FIXED)
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end1Edges=edges_s, ratio=ratio_square, number=number_square, constraint=FIXED)
-                else:
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end2Edges=edges_c, ratio=ratio_circle, number=number_circle, constraint=FIXED)
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end2Edges=edges_s, ratio=ratio_square, number=number_square, constraint=FIXED)
-
-            else:
-
-                if i in [0, 1]:
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end2Edges=edges_c, ratio=ratio_circle, number=number_circle, constraint=FIXED)
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end2Edges=edges_s, ratio=ratio_square, number=number_square, constraint=FIXED)
-                else:
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end1Edges=edges_c, ratio=ratio_circle, number=number_circle, constraint=FIXED)
-                    myPrt.seedEdgeByBias(biasMethod=SINGLE, end1Edges=edges_s, ratio=ratio_square, number=number_square, constraint=FIXED)
-
-    def _seed_edge_face_circumferential_partition(self, myPrt, z):
+    def _seed_edge_face_circumferential_partition(self, myPrt):
         '''
-        Seed the circumferential edges around the hole in one face.
+        Seed the circumferential edges around the hole in both faces.
         '''
         num_circum = self.pMesh['hole_circumferential_num_seedEdgeByNumber']
         
-        #* Hole edges
-        edges = self.get_edges(myPrt, (self.xc_hole - self.r_hole, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole + self.r_hole, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole - self.r_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole + self.r_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        #* Partition circle edges
-        edges = self.get_edges(myPrt, (self.xc_hole - self.r_partition, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole + self.r_partition, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole - self.r_partition, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole + self.r_partition, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        #* Partition square edges
-        edges = self.get_edges(myPrt, (self.xc_hole - 0.5*self.width_partition, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-
-        edges = self.get_edges(myPrt, (self.xc_hole + 0.5*self.width_partition, self.yc_hole, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
-        
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole - 0.5*self.width_partition, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
+        points = [(x, y, z) for z in [0.0, self.len_z] for x, y in self._hole_points_circumferential]
         
-        edges = self.get_edges(myPrt, (self.xc_hole, self.yc_hole + 0.5*self.width_partition, z))
-        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED) 
+        edges = self.get_edges(myPrt, points, batch=True)
+        myPrt.seedEdgeByNumber(edges=edges, number=num_circum, constraint=FIXED)
     
 
 class OpenHolePlateModel(Model):
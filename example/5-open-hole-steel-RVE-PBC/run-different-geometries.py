@@ -0,0 +1,353 @@
+'''
+Run the PBC-3D analysis for Open Hole Plate (OHP) steel RVEs with different geometries.
+
+For each geometry, the six strain vectors run in one Abaqus/CAE session,
+which avoids starting CAE six times per geometry.
+Different geometries run at the same time, each in its own folder `run_i`.
+'''
+
+import os
+import sys
+import time
+import hashlib
+import numpy as np
+import pandas as pd
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from AbaqusTools.functions import clean_pyc_files, clean_temporary_files, run_abaqus_command, prepare_run_folder
+from AbaqusTools.pbc import PBC_3DOrthotropic
+
+
+fname_py = 'job-pbc-3d.py'
+
+#* Each finished geometry appends one line to this file,
+#* which is also read to resume an unfinished sweep
+FNAME_RESULTS_JSONL = 'all-results.jsonl'
+
+#* Results of finished geometries, named by the hash of their parameters and the scripts,
+#* so that a geometry is not computed again in any later sweep.
+#* The cache is not used with `python run-different-geometries.py --no-cache`
+PATH_JOB_CACHE = '.job_cache'
+
+#* Scripts needed by Abaqus/CAE in the folder of each run (besides `AbaqusTools`)
+FILES_RUN = [fname_py, 'open_hole_C3D8R.py']
+
+LIST_LEN_X_PLATE = [30, 40]
+LIST_LEN_Y_PLATE = [30, 40]
+LIST_LEN_Z_PLATE = [5, 10]
+LIST_R_HOLE      = [5, 10]
+
+
+def run_job(index_run, parameters):
+    '''
+    Run the jobs of the six strain vectors of a geometry in one CAE session.
+
+    Parameters
+    ---------------
+    index_run: int
+        index of the geometry.
+
+    parameters: dict
+        parameters of the run.
+
+    Returns
+    ---------------
+    StiffMatrix: ndarray [6,6]
+        the stiffness matrix of the RVE.
+    '''
+    parameters['index_run'] = index_run
+    parameters['strain_vectors'] = list(range(6))
+    parameters.pop('index_strain_vector', None)
+
+    with open('parameters.json', 'w') as f:
+        json.dump(parameters, f)
+
+    run_abaqus_command(['cae', 'noGUI='+fname_py])
+
+    clean_temporary_files('%d'%(index_run))
+
+    #* Six reaction forces, six displacements, and the applied strain (rows)
+    #* of the six strain vectors (columns)
+    data = np.stack([np.loadtxt('Job_OHP_%d_%d-RF.dat'%(index_run, i), usecols=(1,), max_rows=13)
+                        for i in range(6)], axis=1)
+
+    StiffMatrix = data[:6,:]/data[12,:]
+
+    return StiffMatrix
+
+
+def run_job_worker(job):
+    '''
+    Run the jobs of a geometry in the folder `run_i`, 
+    so that the files of different geometries do not collide.
+
+    Parameters
+    ---------------
+    job: tuple
+        (index_run, parameters)
+
+    Returns
+    ---------------
+    index_run: int
+        index of the geometry.
+    
+    result: dict
+        geometry parameters `pGeo` and the `engineering_constants`.
+    '''
+    index_run, parameters = job
+
+    t1 = time.time()
+
+    path = 'run_%d'%(index_run)
+    prepare_run_folder(path, FILES_RUN)
+
+    #* Each worker is a separate process, changing its directory does not affect others.
+    #* The directory is restored, because a worker process runs several jobs.
+    cwd = os.getcwd()
+    os.chdir(path)
+
+    try:
+        StiffMatrix = run_job(index_run, parameters)
+    finally:
+        os.chdir(cwd)
+
+    engineering_constants = PBC_3DOrthotropic.calculate_engineering_constants(StiffMatrix)
+
+    result = {
+        'pGeo': parameters['pGeo'],
+        'engineering_constants': engineering_constants,
+    }
+
+    t2 = time.time()
+
+    print('>>> =============================================')
+    print('>>> Time [geometry %d]: %.2f min'%(index_run, (t2-t1)/60.0))
+    print('>>> =============================================')
+
+    return index_run, result
+
+
+def clone_parameters(parameters):
+    '''
+    Copy the parameters for a geometry. 
+    Only `pGeo` and `pMesh` are copied, the other sub-dicts are not changed and thus shared.
+    '''
+    new_parameters = dict(parameters)
+    new_parameters['pGeo'] = dict(parameters['pGeo'])
+    new_parameters['pMesh'] = dict(parameters['pMesh'])
+    
+    return new_parameters
+
+
+def is_completed(index_run, parameters, all_results):
+    '''
+    Whether the geometry has been computed in a previous sweep, 
+    i.e., its result is in `all_results` with the same geometry parameters,
+    and the output of the last strain vector exists.
+    '''
+    if index_run not in all_results:
+        return False
+    
+    if all_results[index_run]['pGeo'] != parameters['pGeo']:
+        return False
+    
+    return os.path.exists(os.path.join('run_%d'%(index_run), 'Job_OHP_%d_5-RF.dat'%(index_run)))
+
+
+def append_result(f, index_run, result):
+    '''
+    Append the result of a geometry as one line to the opened JSONL file.
+    '''
+    line = dict(result)
+    line['index'] = index_run
+    f.write(json.dumps(line)+'\n')
+    f.flush()
+
+
+def flatten_result(index_run, result):
+    '''
+    Flatten the result of a geometry to a row of the result table,
+    i.e., the geometry parameters `pGeo.*` and the scalar engineering constants.
+    The matrices are kept in `all-results.json`.
+    '''
+    row = {'index': index_run}
+
+    for key, value in result['pGeo'].items():
+        row['pGeo.'+key] = value
+
+    for key, value in result['engineering_constants'].items():
+        if not isinstance(value, list):
+            row[key] = value
+
+    return row
+
+
+def get_scripts_hash():
+    '''
+    Hash of the contents of the scripts run by Abaqus/CAE,
+    so that the cached results are not used after the model is changed.
+    '''
+    sha1 = hashlib.sha1()
+    
+    for fname in FILES_RUN:
+        with open(fname, 'rb') as f:
+            sha1.update(f.read())
+    
+    return sha1.hexdigest()
+
+
+def get_parameters_key(parameters, scripts_hash):
+    '''
+    Hash of the parameters that define the result of a geometry,
+    i.e., without the run index and the strain vector indices,
+    together with the hash of the scripts.
+    '''
+    parameters = dict(parameters)
+    for key in ['index_run', 'index_strain_vector', 'strain_vectors']:
+        parameters.pop(key, None)
+    
+    text = json.dumps(parameters, sort_keys=True) + scripts_hash
+    
+    return hashlib.sha1(text.encode()).hexdigest()
+
+
+def load_cached_result(key):
+    '''
+    Load the result in the job cache, return None if it does not exist.
+    '''
+    fname = os.path.join(PATH_JOB_CACHE, key+'.json')
+    
+    if not os.path.exists(fname):
+        return None
+    
+    with open(fname, 'r') as f:
+        return json.load(f)
+
+
+def save_cached_result(key, result):
+    '''
+    Save the result to the job cache.
+    '''
+    if not os.path.exists(PATH_JOB_CACHE):
+        os.makedirs(PATH_JOB_CACHE)
+    
+    with open(os.path.join(PATH_JOB_CACHE, key+'.json'), 'w') as f:
+        json.dump(result, f)
+
+
+if __name__ == '__main__':
+
+    t0 = time.time()
+
+    clean_pyc_files()
+
+    with open('default-parameters.json', 'r') as f:
+        default_parameters = json.load(f)
+
+    #* Results of a previous (unfinished) sweep
+    all_results = {}
+    if os.path.exists(FNAME_RESULTS_JSONL):
+        with open(FNAME_RESULTS_JSONL, 'r') as f:
+            for line in f:
+                result = json.loads(line)
+                all_results[int(result.pop('index'))] = result
+
+    use_cache = '--no-cache' not in sys.argv[1:]
+    scripts_hash = get_scripts_hash()
+
+    jobs = []
+    index_run = 0
+
+    #* Geometry parameters of each run in this sweep
+    geometries = {}
+
+    #* Hash of the parameters of each geometry, and the results loaded from the job cache
+    keys = {}
+    cached_results = {}
+
+    for len_x_plate in LIST_LEN_X_PLATE:
+        for len_y_plate in LIST_LEN_Y_PLATE:
+            for len_z_plate in LIST_LEN_Z_PLATE:
+                for r_hole in LIST_R_HOLE:
+
+                    #* The hole diameter should be less than half of the plate width
+                    if len_x_plate <= 4*r_hole or len_y_plate <= 4*r_hole:
+                        continue
+
+                    parameters = clone_parameters(default_parameters)
+                    parameters['pGeo']['len_x_plate'] = len_x_plate
+                    parameters['pGeo']['len_y_plate'] = len_y_plate
+                    parameters['pGeo']['len_z_plate'] = len_z_plate
+                    parameters['pGeo']['r_hole'] = r_hole
+
+                    geometries[index_run] = parameters['pGeo']
+                    keys[index_run] = get_parameters_key(parameters, scripts_hash)
+
+                    #* Skip the geometry that is completed in a previous sweep,
+                    #* or has the same parameters as a cached job,
+                    #* the index still increases so that the numbering does not change
+                    if not is_completed(index_run, parameters, all_results):
+
+                        cached_result = load_cached_result(keys[index_run]) if use_cache else None
+
+                        if cached_result is not None:
+                            cached_results[index_run] = cached_result
+                        else:
+                            jobs.append((index_run, parameters))
+
+                    index_run += 1
+
+    #* Only keep the previous results of the geometries in this sweep
+    all_results = dict((index, result) for index, result in all_results.items()
+                        if index in geometries and result['pGeo'] == geometries[index])
+
+    #* Independent geometries run at the same time, as many as the CPU cores allow
+    num_workers = max(1, (os.cpu_count() or 1)//default_parameters['pRun']['numCpus'])
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor, \
+            open(FNAME_RESULTS_JSONL, 'a') as f:
+
+        #* A cached result is appended only if it is not recorded yet
+        for index_run, result in sorted(cached_results.items()):
+            if all_results.get(index_run) != result:
+                all_results[index_run] = result
+                append_result(f, index_run, result)
+
+        #* Index of the geometry of each future
+        futures = dict((executor.submit(run_job_worker, job), job[0]) for job in jobs)
+        failed_runs = []
+
+        for future in as_completed(futures):
+
+            #* A failed geometry is not recorded, so that it runs again in the next sweep,
+            #* the other geometries are still collected
+            try:
+                index_run, result = future.result()
+            except Exception as e:
+                failed_runs.append(futures[future])
+                print('>>> [Error] geometry %d failed: %s'%(futures[future], repr(e)))
+                continue
+
+            #* Save the result as soon as the geometry is finished
+            all_results[index_run] = result
+            append_result(f, index_run, result)
+            save_cached_result(keys[index_run], result)
+
+    all_results = dict(sorted(all_results.items()))
+
+    with open('all-results.json', 'w') as f:
+        json.dump(all_results, f, indent=4)
+
+    #* One row for each geometry
+    rows = [flatten_result(index_run, result) for index_run, result in all_results.items()]
+    pd.DataFrame(rows).to_csv('all-results.csv', index=False)
+
+    if len(failed_runs) > 0:
+        print('>>> [Error] failed geometries: %s'%(str(sorted(failed_runs))))
+
+    t2 = time.time()
+
+    print('>>> =============================================')
+    print('>>> Time [total]: %.2f min'%((t2-t0)/60.0))
+    print('>>> =============================================')
@@ -6,15 +6,75 @@ import os
 import time
 import numpy as np
 import json
+from concurrent.futures import ProcessPoolExecutor
 
-from AbaqusTools.functions import clean_pyc_files, clean_temporary_files
+from AbaqusTools.functions import clean_pyc_files, clean_temporary_files, run_abaqus_command, prepare_run_folder
 from AbaqusTools.pbc import PBC_3DOrthotropic
 
 
-COMMAND = 'abaqus cae noGUI='
-
 fname_py = 'job-pbc-3d.py'
 
+#* Scripts needed by Abaqus/CAE in the folder of each case (besides `AbaqusTools`)
+FILES_RUN = [fname_py, 'open_hole_C3D8R.py']
+
+
+def run_case(i, parameters):
+    '''
+    Run the job of the i-th strain vector in the folder `case_i`,
+    so that the CAE sessions running at the same time do not share 
+    `abaqus.rpy` and other temporary files.
+    
+    Parameters
+    ---------------
+    i: int
+        index of the strain vector, 0~5.
+        
+    parameters: dict
+        parameters of the run.
+    
+    Returns
+    ---------------
+    i: int
+        index of the strain vector.
+    
+    column: ndarray [6]
+        the i-th column of the stiffness matrix.
+    '''
+    t1 = time.time()
+    
+    path = 'case_%d'%(i)
+    prepare_run_folder(path, FILES_RUN)
+    
+    #* The directory is restored, because a worker process runs several cases.
+    cwd = os.getcwd()
+    os.chdir(path)
+    
+    try:
+        
+        with open('parameters.json', 'w') as f:
+            json.dump(parameters, f)
+        
+        run_abaqus_command(['cae', 'noGUI='+fname_py, '--', '%d'%(i)])
+        
+        clean_temporary_files('%d'%(i))
+        
+        name_job = 'Job_OHP_%d_%d'%(parameters['index_run'], i)
+
+        #* Six reaction forces, six displacements, and the applied strain
+        data = np.loadtxt(name_job+'-RF.dat', usecols=(1,), max_rows=13)
+        column = data[:6]/data[12]
+    
+    finally:
+        os.chdir(cwd)
+    
+    t2 = time.time()
+    
+    print('>>> =============================================')
+    print('>>> Time [strain vector %d]: %.2f min'%(i, (t2-t1)/60.0))
+    print('>>> =============================================')
+    
+    return i, column
+
 
 if __name__ == '__main__':
     
@@ -25,46 +85,27 @@ if __name__ == '__main__':
     with open('default-parameters.json', 'r') as f:
         default_parameters = json.load(f)
     
-    index_run = default_parameters['index_run']
+    #* `index_strain_vector` is given in the command line of each case
+    default_parameters.pop('index_strain_vector', None)
+    
     StiffMatrix = np.zeros([6,6])
 
-    for i in range(6):
-        
-        print('>>> =============================================')
-        t1 = time.time()
-        
-        default_parameters['index_strain_vector'] = i
-        with open('parameters.json', 'w') as f:
-            json.dump(default_parameters, f, indent=4)
-            
-        scale = default_parameters['strain_scale']
-        
-        os.system(COMMAND+fname_py)
-        
-        clean_temporary_files('%d'%(i))
-        
-        name_job = 'Job_OHP_%d_%d'%(index_run, i)
+    #* The six strain vectors are independent jobs,
+    #* run as many of them at a time as the CPU cores allow
+    num_workers = max(1, min(6, (os.cpu_count() or 1)//default_parameters['pRun']['numCpus']))
 
-        with open(name_job+'-RF.dat', 'r') as f:
-            lines = f.readlines()
-            
-            for j in range(6):
-                StiffMatrix[j,i] = float(lines[j].split()[1])/scale
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
         
-        t2 = time.time()
-        
-        print('>>> Time [strain vector %d]: %.2f min'%(i, (t2-t1)/60.0))
-        print('>>> =============================================')
-
+        for i, column in executor.map(run_case, range(6), [default_parameters]*6):
+            StiffMatrix[:,i] = column
 
     engineering_constants = PBC_3DOrthotropic.calculate_engineering_constants(StiffMatrix)
 
     with open('homogenized-properties.json', 'w') as f:
         json.dump(engineering_constants, f, indent=4)
 
+    t2 = time.time()
+
     print('>>> =============================================')
     print('>>> Time [total]: %.2f min'%((t2-t0)/60.0))
     print('>>> =============================================')
-
-    
-
@@ -8,57 +8,71 @@ SPECTRUM_NAME = "plasma"
 N_COLORS = 64           # 64-256 typical
 # --------------------------------
 
+import numpy as np
 from abaqus import session
 
 # ---------- Color helpers ----------
+# Two-digit hex of 0-255, looked up instead of formatting each channel
+_HEX = ["%02X" % i for i in range(256)]
+
 def rgb01_to_hex(rgb):
-    r = int(round(max(0.0, min(1.0, float(rgb[0]))) * 255))
-    g = int(round(max(0.0, min(1.0, float(rgb[1]))) * 255))
-    b = int(round(max(0.0, min(1.0, float(rgb[2]))) * 255))
-    return "#{:02X}{:02X}{:02X}".format(r, g, b)
+    return rgb01_array_to_hex([rgb[:3]])[0]
+
+def rgb01_array_to_hex(rgb):
+    ints = np.floor(np.clip(np.asarray(rgb, dtype=float), 0.0, 1.0) * 255 + 0.5).astype(int)
+    return ["#" + _HEX[r] + _HEX[g] + _HEX[b] for r, g, b in ints.tolist()]
+
+def hex_to_rgb01(h):
+    h = h.lstrip("#")
+    return (int(h[0:2],16)/255.0, int(h[2:4],16)/255.0, int(h[4:6],16)/255.0)
+
+# Fallback key plasma colors (approximate), parsed once as a (K, 3) array
+PLASMA_KEYS = np.array([hex_to_rgb01(h) for h in [
+    "#0D0887","#3A049A","#5C01A6","#7E03A8","#9C179E",
+    "#B52F8C","#CC4778","#DD5E66","#EA7851","#F3943E",
+    "#FBB227","#F7D13D","#F0F921"
+]])
+
+def interpolate_key_colors(keys, n):
+    # Linear interpolation of `n` colors between the (K, 3) key colors.
+    # Segment index `a` and local position `lt` of all samples,
+    # the last sample is the end (lt=1) of the last segment,
+    # no color for n < 1
+    m = len(keys) - 1
+    pos = np.linspace(0.0, m, n) if n > 1 else np.zeros(max(n, 0))
+    a = np.minimum(pos.astype(np.intp), m - 1)
+    lt = (pos - a)[:, None]
+    return keys[a]*(1.0 - lt) + keys[a + 1]*lt
+
+# Hex colors of each `n` already made in this session
+_PLASMA_HEX_CACHE = {}
 
 def get_plasma_hex_colors(n=256):
+    # A tuple is returned, so that the cached colors can not be changed by the caller
+    # (functools.lru_cache is not available in the Python 2 of Abaqus/CAE)
+    if n < 1:
+        return ()
+    if n not in _PLASMA_HEX_CACHE:
+        _PLASMA_HEX_CACHE[n] = tuple(_make_plasma_hex_colors(n))
+    return _PLASMA_HEX_CACHE[n]
+
+def _make_plasma_hex_colors(n):
     try:
         import matplotlib.cm as cm
         cmap = cm.get_cmap("plasma", n)
-        return [rgb01_to_hex(cmap(i)[:3]) for i in range(cmap.N)]
+        # One call evaluates all colors as an (N, 4) RGBA array
+        rgba = cmap(np.arange(cmap.N))
+        return rgb01_array_to_hex(rgba[:, :3])
     except Exception:
-        # Fallback key plasma colors (approximate), with linear interpolation
-        key_hex = [
-            "#0D0887","#3A049A","#5C01A6","#7E03A8","#9C179E",
-            "#B52F8C","#CC4778","#DD5E66","#EA7851","#F3943E",
-            "#FBB227","#F7D13D","#F0F921"
-        ]
-        def hex_to_rgb01(h):
-            h = h.lstrip("#")
-            return (int(h[0:2],16)/255.0, int(h[2:4],16)/255.0, int(h[4:6],16)/255.0)
-        keys = [hex_to_rgb01(h) for h in key_hex]
-
-        import math
-        out = []
-        m = len(keys) - 1
-        for i in range(n):
-            t = float(i) / (n - 1 if n > 1 else 1.0)
-            pos = t * m
-            a = int(math.floor(pos))
-            b = min(a + 1, m)
-            lt = pos - a
-            r = keys[a][0]*(1-lt) + keys[b][0]*lt
-            g = keys[a][1]*(1-lt) + keys[b][1]*lt
-            b_ = keys[a][2]*(1-lt) + keys[b][2]*lt
-            out.append(rgb01_to_hex((r, g, b_)))
-        return out
+        return rgb01_array_to_hex(interpolate_key_colors(PLASMA_KEYS, n))
 
 # ---------- Spectrum management ----------
 def delete_spectrum_if_exists(name):
-    if name in session.spectrums.keys():
-        try:
-            del session.spectrums[name]
-        except:
-            pass
+    if name in session.spectrums:
+        del session.spectrums[name]
 
 def create_spectrum(name, color_hex_list):
-    colors_tuple = tuple(str(c) for c in color_hex_list)
+    colors_tuple = color_hex_list if isinstance(color_hex_list, tuple) else tuple(color_hex_list)
     spec = session.Spectrum(name=name, colors=colors_tuple)
     return spec
 